@@ -204,31 +204,36 @@ class BehaviorCorrelator:
     
     def correlate_with_commits(self, patterns: List[Pattern], days: int = 90) -> Dict:
         """Correlate patterns with git commit messages."""
-        commits = self.git_parser.get_commits(max_count=500)
-        
-        correlations = []
-        
-        for pattern in patterns:
-            # Search commits for keywords from pattern
-            keywords = self._extract_keywords(pattern.description)
+        # Keywords from each pattern, matched against every commit in one pass
+        keywords = [
+            [keyword.lower() for keyword in self._extract_keywords(pattern.description)]
+            for pattern in patterns
+        ]
+        matches = [[] for _ in patterns]
+        
+        for commit in self.git_parser.get_commits(max_count=500):
+            commit_text = None
             
-            matching_commits = []
-            for commit in commits:
+            for pattern, pattern_keywords, matching_commits in zip(patterns, keywords, matches):
                 # Check if commit is within 7 days of pattern
                 days_diff = abs((commit.date - pattern.date).days)
                 if days_diff > 7:
                     continue
                 
                 # Check for keyword matches
-                commit_text = f"{commit.message} {' '.join(commit.files_changed)}"
-                if any(keyword.lower() in commit_text.lower() for keyword in keywords):
+                if commit_text is None:
+                    commit_text = f"{commit.message} {' '.join(commit.files_changed)}".lower()
+                if any(keyword in commit_text for keyword in pattern_keywords):
                     matching_commits.append({
                         'hash': commit.hash[:7],
                         'message': commit.message,
                         'date': commit.date.isoformat(),
                         'days_diff': days_diff
                     })
-            
+        
+        correlations = []
+        
+        for pattern, matching_commits in zip(patterns, matches):
             if matching_commits:
                 correlations.append({
                     'pattern': {
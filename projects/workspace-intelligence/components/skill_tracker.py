@@ -82,13 +82,8 @@ class SkillTracker:
     
     def get_daily_activity(self, days: int = 14) -> List[Tuple[str, int]]:
         """Get daily skill invocation counts."""
-        invocations = self.parser.get_all_skill_invocations(days=days)
-        
-        # Group by date
-        by_date = {}
-        for inv in invocations:
-            date_key = inv.timestamp.strftime('%Y-%m-%d')
-            by_date[date_key] = by_date.get(date_key, 0) + 1
+        # Group by date over the columnar batch
+        by_date = self.parser.get_invocation_batch(days=days).daily_counts()
         
         # Fill in missing dates with 0
         start_date = datetime.now() - timedelta(days=days)
@@ -0,0 +1,34 @@
+# conftest.py
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from git_helpers import add_commits, git
+from session_helpers import write_sessions
+from utils.git_parser import CommitStore
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository with 300 commits on main."""
+    path = tmp_path / 'repo'
+    path.mkdir()
+    git(path, 'init', '-q', '-b', 'main')
+    add_commits(path, 300)
+    CommitStore._stores.clear()
+    yield path
+    CommitStore._stores.clear()
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """A workspace with JSON object, JSON array and JSONL session files."""
+    path = tmp_path / 'workspace'
+    sessions = path / '.claude' / 'sessions'
+    sessions.mkdir(parents=True)
+    write_sessions(sessions)
+    return path
@@ -0,0 +1,36 @@
+# git_helpers.py
+import subprocess
+from pathlib import Path
+
+
+BASE_EPOCH = 1_700_000_000
+
+
+def git(repo: Path, *args: str, stdin: str = None) -> str:
+    """Run git in repo and return stdout."""
+    return subprocess.run(
+        ['git', *args], cwd=repo, input=stdin, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def add_commits(repo: Path, count: int, start: int = 0):
+    """Append count commits (one hour apart, one file each) via fast-import."""
+    parent = git(repo, 'rev-parse', '--verify', '-q', 'HEAD').strip() if start else ''
+    stream = []
+    for i in range(start, start + count):
+        epoch = BASE_EPOCH + i * 3600
+        message = f'commit {i}\n\nbody line {i}\n'
+        content = f'{i}\n'
+        stream.append('commit refs/heads/main')
+        stream.append(f'committer Test <test@example.com> {epoch} +0000')
+        stream.append(f'data {len(message.encode())}\n{message}')
+        if parent:
+            stream.append(f'from {parent}')
+            parent = ''
+        stream.append(f'M 644 inline file{i % 7}.txt\ndata {len(content)}\n{content}')
+    git(repo, 'fast-import', '--quiet', stdin='\n'.join(stream) + '\n')
+    git(repo, 'reset', '-q', '--hard', 'main')
+
+
+def log_hashes(repo: Path, *args: str):
+    return git(repo, 'log', '--format=%H', *args).split()
@@ -0,0 +1,49 @@
+# session_helpers.py
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BASE_TIME = datetime(2026, 1, 1, 9, 0)
+
+# Timestamp suffix -> skill name prefix: UTC, a fixed offset and naive
+# wall clock. Each skill keeps to one kind so naive and aware never mix.
+ZONES = {'Z': 'utc', '+02:00': 'east', '': 'local'}
+
+
+def message(i: int, zone: str) -> dict:
+    """A message mentioning one skill and calling another."""
+    timestamp = (BASE_TIME + timedelta(minutes=97 * i)).isoformat() + zone
+    return {
+        'content': f'Using skill: {ZONES[zone]}-{"abcde"[i % 5]} for step {i}',
+        'timestamp': timestamp,
+        'tool_calls': [{'name': f'{ZONES[zone]}-tool-{i % 3}'}],
+    }
+
+
+def event(i: int, zone: str) -> dict:
+    """A skill event that fails every third time."""
+    return {
+        'type': 'skill_invoked',
+        'skill': f'{ZONES[zone]}-event',
+        'timestamp': (BASE_TIME + timedelta(hours=11 * i)).isoformat() + zone,
+        'success': i % 3 != 0,
+    }
+
+
+def write_sessions(sessions: Path, count: int = 40):
+    """One session file per layout, one timestamp zone each."""
+    object_zone, array_zone, lines_zone = ZONES
+    (sessions / 'object.json').write_text(json.dumps({
+        'messages': [message(i, object_zone) for i in range(count)],
+        'events': [event(i, object_zone) for i in range(count // 4)],
+    }))
+    (sessions / 'array.json').write_text(json.dumps(
+        [message(i, array_zone) for i in range(count)]
+    ))
+    nested = sessions / 'nested'
+    nested.mkdir()
+    (nested / 'lines.jsonl').write_text(''.join(
+        json.dumps(item) + '\n'
+        for i in range(count)
+        for item in (message(i, lines_zone), event(i, lines_zone))
+    ))
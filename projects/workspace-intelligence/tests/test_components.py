@@ -0,0 +1,30 @@
+# test_components.py
+from datetime import datetime
+
+from git_helpers import BASE_EPOCH, add_commits, log_hashes
+from components.behavior_correlator import BehaviorCorrelator, Pattern
+from components.health_monitor import Project
+from utils.git_parser import CommitStore
+
+
+def test_health_check_reads_only_its_commit_limit(repo):
+    """HealthMonitor's 100-commit check does not read the whole history."""
+    project = Project(repo)
+    project._analyze_git()
+
+    assert project.commit_count == 100
+    assert len(CommitStore.for_path(repo).commits) == 100
+
+
+def test_correlation_reads_only_its_commit_limit(repo):
+    """correlate_with_commits reads at most its 500-commit limit."""
+    add_commits(repo, 300, start=300)
+    newest = datetime.fromtimestamp(BASE_EPOCH + 599 * 3600)
+    patterns = [Pattern('miss', newest, 'test', 'commit body line')]
+
+    result = BehaviorCorrelator(str(repo)).correlate_with_commits(patterns)
+
+    matches = result['correlations'][0]['matching_commits']
+    assert matches[0]['hash'] == log_hashes(repo)[0][:7]
+    store = CommitStore.for_path(repo)
+    assert len(store.commits) == 500 and not store.complete
@@ -0,0 +1,152 @@
+# test_git_parser.py
+import os
+import shutil
+import subprocess
+from datetime import datetime, timedelta
+
+import pytest
+
+from git_helpers import BASE_EPOCH, add_commits, git, log_hashes
+from utils.git_parser import CommitStore, GitParser
+
+
+def test_max_count_query_reads_only_requested_window(repo):
+    """A max_count=100 query must not parse the whole history."""
+    commits = GitParser(str(repo)).get_commits(max_count=100)
+    store = CommitStore.for_path(repo)
+
+    assert [c.hash for c in commits] == log_hashes(repo, '--max-count=100')
+    assert len(store.commits) == 100
+    assert not store.complete
+
+
+def test_window_grows_on_demand_and_matches_git(repo):
+    """Deeper and unbounded queries extend the window and match git log."""
+    parser = GitParser(str(repo))
+    parser.get_commits(max_count=10)
+
+    assert [c.hash for c in parser.get_commits(max_count=250)] == log_hashes(repo, '--max-count=250')
+    assert [c.hash for c in parser.get_commits()] == log_hashes(repo)
+    assert CommitStore.for_path(repo).complete
+
+
+def test_since_query_reads_back_to_the_date(repo):
+    """A since query stops reading once it is past the requested date."""
+    since = datetime.fromtimestamp(BASE_EPOCH + 250 * 3600)
+    commits = GitParser(str(repo)).get_commits(since=since)
+
+    assert [c.hash for c in commits] == log_hashes(repo, f'--since={BASE_EPOCH + 250 * 3600}')
+    assert len(CommitStore.for_path(repo).commits) < 300
+
+
+def test_refresh_fetches_new_commits_and_handles_rewrites(repo):
+    """New commits are prepended; rewritten history is read again."""
+    parser = GitParser(str(repo))
+    parser.get_commits(max_count=5)
+    store = CommitStore.for_path(repo)
+    window = len(store.commits)
+
+    add_commits(repo, 3, start=300)
+    store.refresh(force=True)
+    assert len(store.commits) == window + 3
+    assert [c.hash for c in parser.get_commits(max_count=8)] == log_hashes(repo, '--max-count=8')
+
+    git(repo, 'reset', '-q', '--hard', 'HEAD~5')
+    git(repo, '-c', 'user.name=T', '-c', 'user.email=t@e', 'commit', '-q', '--allow-empty', '-m', 'rewritten')
+    store.refresh(force=True)
+    assert [c.hash for c in parser.get_commits(max_count=5)] == log_hashes(repo, '--max-count=5')
+    assert parser.get_commits(max_count=1)[0].message == 'rewritten'
+
+
+def test_commit_fields_match_numstat(repo):
+    """Parsed records keep subject, author date and numstat file lists."""
+    commit = GitParser(str(repo)).get_commits(max_count=1)[0]
+
+    assert commit.message == 'commit 299'
+    assert commit.files_changed == ['file5.txt']
+    assert commit.insertions == 1
+    assert commit.committed_at == BASE_EPOCH + 299 * 3600
+
+
+def test_store_registry_is_bounded(tmp_path, monkeypatch):
+    """Only the most recently used MAX_STORES repositories stay cached."""
+    monkeypatch.setattr(CommitStore, 'MAX_STORES', 2)
+    CommitStore._stores.clear()
+    repos = []
+    for name in 'abc':
+        path = tmp_path / name
+        path.mkdir()
+        git(path, 'init', '-q')
+        repos.append(path)
+        CommitStore.for_path(path)
+
+    assert len(CommitStore._stores) == 2
+    assert str(repos[0].resolve()) not in CommitStore._stores
+    CommitStore._stores.clear()
+
+
+
+def shim_git(tmp_path, monkeypatch, log_script: str):
+    """Put a git wrapper on PATH whose `git log` runs log_script."""
+    real_git = shutil.which('git')
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    shim = bin_dir / 'git'
+    shim.write_text(
+        '#!/bin/bash\n'
+        'if [ "$1" = "log" ]; then\n'
+        f'{log_script}\n'
+        'fi\n'
+        f'exec {real_git} "$@"\n'
+    )
+    shim.chmod(0o755)
+    monkeypatch.setenv('PATH', f'{bin_dir}:' + os.environ['PATH'])
+
+
+RECORD = r"printf '\x1e%s\x00me\x002024-01-01 10:00:00 +0000\x001704103200\x00%s\x00\x00\n' "
+
+
+def test_iter_commits_raises_after_partial_stream(repo, tmp_path, monkeypatch):
+    """A git failure after some commits were yielded is not hidden as a short history."""
+    shim_git(tmp_path, monkeypatch, RECORD + 'aaa first; ' + RECORD + 'bbb second; exit 1')
+    parser = GitParser(str(repo), use_store=False)
+
+    seen = []
+    with pytest.raises(subprocess.CalledProcessError):
+        for commit in parser.iter_commits():
+            seen.append(commit.message)
+
+    assert seen == ['first', 'second']
+    assert parser.get_commits() == []
+
+
+def test_iter_commits_raises_on_idle_timeout(repo, tmp_path, monkeypatch):
+    """A stalled git log raises TimeoutExpired instead of ending quietly."""
+    shim_git(tmp_path, monkeypatch, RECORD + 'aaa first; ' + RECORD + 'bbb second; sleep 5')
+    parser = GitParser(str(repo), use_store=False)
+
+    seen = []
+    with pytest.raises(subprocess.TimeoutExpired):
+        for commit in parser.iter_commits(idle_timeout=0.5):
+            seen.append(commit.message)
+
+    assert seen == ['first']
+
+
+def test_commit_velocity_matches_naive_window(monkeypatch):
+    """Prefix-sum velocity equals counting each inclusive window directly."""
+    now = datetime.now()
+    dates = [now - timedelta(days=d, hours=h) for d in range(0, 400, 3) for h in (1, 5)]
+    dates += [now - timedelta(days=500), now + timedelta(days=2)]
+    commits = [type('C', (), {'date': d})() for d in dates]
+    monkeypatch.setattr(GitParser, 'get_commits', lambda self, **kwargs: commits)
+
+    parser = GitParser('/tmp')
+    velocities = parser.get_commit_velocities([0, 7, 30], lookback_days=365)
+
+    for window, series in velocities.items():
+        assert series == parser.get_commit_velocity(window, 365)
+        for day_iso, count in series:
+            day = datetime.fromisoformat(day_iso).date()
+            expected = sum(1 for d in dates if day - timedelta(days=window) <= d.date() <= day)
+            assert count == expected
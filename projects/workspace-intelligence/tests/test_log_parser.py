@@ -0,0 +1,133 @@
+# test_log_parser.py
+import json
+import os
+from collections import Counter
+
+import pytest
+
+from utils.log_parser import LogParser, _to_record
+
+
+def _records(invocations):
+    """Comparable form of parsed invocations."""
+    return [_to_record(inv) for inv in invocations]
+
+
+def _count_parses(monkeypatch):
+    """Record every session file parsed in this process."""
+    parsed = []
+    parse = LogParser.parse_session_file
+
+    def counting_parse(self, file_path, stream=None):
+        parsed.append(file_path.name)
+        return parse(self, file_path, stream)
+
+    monkeypatch.setattr(LogParser, 'parse_session_file', counting_parse)
+    return parsed
+
+
+def test_streaming_parse_matches_json_parse(workspace):
+    """Incremental parsing yields the same invocations as json.load."""
+    parser = LogParser(str(workspace), use_index=False)
+    files = parser.find_session_files()
+    assert len(files) == 3
+
+    for file in files:
+        streamed = parser.parse_session_file(file, stream=True)
+        loaded = parser.parse_session_file(file, stream=False)
+        assert streamed and _records(streamed) == _records(loaded)
+
+
+def test_ijson_stream_matches_json_load(tmp_path):
+    """With ijson installed, streamed items keep json.load's types."""
+    pytest.importorskip('ijson')
+    session = tmp_path / 'session.json'
+    data = {
+        'messages': [{'content': 'x', 'cost': 0.1, 'tokens': 12, 'scores': [1.5, 2, 1e-7]}],
+        'events': [{'type': 'skill_done', 'skill': 'y', 'duration': 0.30000000000000004}],
+    }
+    session.write_text(json.dumps(data))
+    parser = LogParser(str(tmp_path), use_index=False)
+
+    streamed = list(parser.iter_session_items(session, stream=True))
+    loaded = list(parser.iter_session_items(session, stream=False))
+
+    assert streamed == loaded
+    assert type(streamed[0][1]['cost']) is float
+    assert type(streamed[1][1]['duration']) is float
+
+
+def test_streaming_parse_rejects_malformed_files(workspace):
+    """A truncated JSON file is skipped in both modes."""
+    broken = workspace / '.claude' / 'sessions' / 'broken.json'
+    broken.write_text('{"messages": [{"content": "Using skill: x"}')
+    parser = LogParser(str(workspace), use_index=False)
+
+    assert parser.parse_session_file(broken, stream=True) == []
+    assert parser.parse_session_file(broken, stream=False) == []
+
+
+def test_process_pool_parse_matches_in_process_parse(workspace):
+    """Sharding files across worker processes does not change the result."""
+    in_process = LogParser(str(workspace), use_index=False).get_all_skill_invocations()
+    pooled = LogParser(str(workspace), use_index=False, workers=2).get_all_skill_invocations()
+
+    assert in_process and _records(pooled) == _records(in_process)
+
+
+def test_index_reuses_unchanged_files(workspace, monkeypatch):
+    """A second read is served from the index without parsing anything."""
+    expected = _records(LogParser(str(workspace), use_index=False).get_all_skill_invocations())
+    first = _records(LogParser(str(workspace)).get_all_skill_invocations())
+    parsed = _count_parses(monkeypatch)
+
+    second = _records(LogParser(str(workspace)).get_all_skill_invocations())
+
+    assert parsed == []
+    assert first == second == expected
+
+
+def test_index_reparses_changed_and_forgets_deleted_files(workspace, monkeypatch):
+    """Only the changed file is parsed again; removed files drop out."""
+    sessions = workspace / '.claude' / 'sessions'
+    LogParser(str(workspace)).get_all_skill_invocations()
+    parsed = _count_parses(monkeypatch)
+
+    changed = sessions / 'array.json'
+    changed.write_text(json.dumps([
+        {'content': 'Using skill: fresh', 'timestamp': '2026-02-01T00:00:00Z'}
+    ]))
+    stat = changed.stat()
+    os.utime(changed, (stat.st_atime, stat.st_mtime + 10))
+    (sessions / 'object.json').unlink()
+
+    invocations = LogParser(str(workspace)).get_all_skill_invocations()
+
+    assert parsed == ['array.json']
+    assert 'fresh' in {inv.skill_name for inv in invocations}
+    assert not {inv.session_id for inv in invocations} & {'object'}
+    assert _records(invocations) == _records(
+        LogParser(str(workspace), use_index=False).get_all_skill_invocations()
+    )
+
+
+def test_usage_stats_match_per_invocation_aggregation(workspace):
+    """Columnar group-bys agree with aggregating invocation objects directly."""
+    parser = LogParser(str(workspace), use_index=False)
+    invocations = parser.get_all_skill_invocations()
+
+    expected = {}
+    for skill in {inv.skill_name for inv in invocations}:
+        uses = [inv for inv in invocations if inv.skill_name == skill]
+        expected[skill] = {
+            'count': len(uses),
+            'last_used': max(inv.timestamp for inv in uses).isoformat(),
+            'first_used': min(inv.timestamp for inv in uses).isoformat(),
+            'success_rate': sum(inv.success for inv in uses) / len(uses),
+            'session_count': len({inv.session_id for inv in uses if inv.session_id}),
+        }
+
+    assert parser.get_skill_usage_stats() == expected
+    assert parser.get_invocation_batch().daily_counts() == dict(sorted(Counter(
+        inv.timestamp.strftime('%Y-%m-%d') for inv in invocations
+    ).items()))
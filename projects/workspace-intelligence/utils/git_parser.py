@@ -5,20 +5,36 @@ Parses git history for commit analysis, skill usage patterns, and learning veloc
 """
 
 import subprocess
+import threading
+import queue
+import time
 import re
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional: velocity falls back to pure Python
+    np = None
+
+
+# Records start with \x1e; fields are NUL-separated and numstat lines
+# follow the last NUL. %ct (committer epoch) backs --since/--until filtering.
+LOG_FORMAT = '%x1e%H%x00%an%x00%ai%x00%ct%x00%s%x00%b%x00'
 
 
 class GitCommit:
     """Represents a single git commit with parsed metadata."""
     
-    def __init__(self, hash: str, author: str, date: datetime, message: str):
+    def __init__(self, hash: str, author: str, date: datetime, message: str,
+                 committed_at: Optional[float] = None):
         self.hash = hash
         self.author = author
         self.date = date
         self.message = message
+        self.committed_at = committed_at
         self.files_changed = []
         self.insertions = 0
         self.deletions = 0
@@ -27,26 +43,256 @@ class GitCommit:
         return f"<GitCommit {self.hash[:7]} '{self.message[:50]}'>"
 
 
+def _run_git(args: List[str], cwd: Path, timeout: float = 30) -> Optional[str]:
+    """Run a git command; stdout on success, None on any failure."""
+    try:
+        result = subprocess.run(
+            ['git'] + args,
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, NotADirectoryError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _stream_git_log(args: List[str], cwd: Path, idle_timeout: Optional[float] = 30) -> Iterator[str]:
+    """
+    Run git log with LOG_FORMAT and yield raw records as they arrive.
+    
+    stdout is read line by line on a helper thread, so there is no limit
+    on total runtime; only idle_timeout seconds without any output abort
+    the command. Raises subprocess.TimeoutExpired on idle timeout and
+    subprocess.CalledProcessError if git exits non-zero. Closing the
+    generator early kills git.
+    """
+    cmd = ['git', 'log', f'--pretty=format:{LOG_FORMAT}', '--numstat'] + args
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors='replace'
+    )
+    records: queue.Queue = queue.Queue(maxsize=256)
+    stop = threading.Event()
+    last_output = [time.monotonic()]
+    
+    def put(item):
+        while not stop.is_set():
+            try:
+                records.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def reader():
+        record = []
+        with proc.stdout:
+            for line in proc.stdout:
+                last_output[0] = time.monotonic()
+                if line.startswith('\x1e') and record:
+                    put(''.join(record))
+                    record = []
+                record.append(line)
+                if stop.is_set():
+                    return
+        if record:
+            put(''.join(record))
+        put(None)
+    
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    
+    try:
+        while True:
+            try:
+                record = records.get(timeout=idle_timeout)
+            except queue.Empty:
+                # A long record may still be arriving line by line
+                if time.monotonic() - last_output[0] < idle_timeout:
+                    continue
+                raise subprocess.TimeoutExpired(cmd, idle_timeout)
+            if record is None:
+                break
+            yield record
+        
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+    finally:
+        stop.set()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+class CommitStore:
+    """
+    Cached window of one repository's history, shared per repository.
+    
+    Holds the newest commits reachable from HEAD in git log order, read in
+    chunks only as deep as queries need: a max_count=100 query reads about
+    100 commits, a since query reads back to that date, and only an
+    unbounded query reads the whole history. When HEAD moves forward just
+    the new commits are fetched; if history was rewritten the window is
+    dropped and read again on demand. HEAD is checked at most every
+    head_check_interval seconds. At most MAX_STORES repositories are kept,
+    least recently used first out.
+    """
+    
+    MAX_STORES = 8
+    MIN_CHUNK = 100
+    
+    _stores: 'OrderedDict[str, CommitStore]' = OrderedDict()
+    _toplevels: Dict[str, Optional[str]] = {}
+    _registry_lock = threading.Lock()
+    
+    def __init__(self, toplevel: str, head_check_interval: float = 2.0):
+        self.toplevel = Path(toplevel)
+        self.head_check_interval = head_check_interval
+        self.head: Optional[str] = None
+        self.commits: List[GitCommit] = []
+        self.complete = False  # window reaches the root commit(s)
+        self._hashes = set()
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def toplevel_for(cls, path: Path) -> Optional[str]:
+        """Repository root for a path (cached); None if not in a repository."""
+        key = str(Path(path).resolve())
+        with cls._registry_lock:
+            if key in cls._toplevels:
+                return cls._toplevels[key]
+        
+        output = _run_git(['rev-parse', '--show-toplevel'], Path(path), timeout=5)
+        toplevel = output.strip() if output else None
+        with cls._registry_lock:
+            cls._toplevels[key] = toplevel
+        return toplevel
+    
+    @classmethod
+    def for_path(cls, path: Path) -> Optional['CommitStore']:
+        """Shared store for the repository containing path."""
+        toplevel = cls.toplevel_for(path)
+        if toplevel is None:
+            return None
+        with cls._registry_lock:
+            store = cls._stores.get(toplevel)
+            if store is None:
+                store = cls._stores[toplevel] = cls(toplevel)
+            cls._stores.move_to_end(toplevel)
+            while len(cls._stores) > cls.MAX_STORES:
+                cls._stores.popitem(last=False)
+            return store
+    
+    def refresh(self, force: bool = False):
+        """Bring the window up to HEAD (throttled unless forced)."""
+        with self._lock:
+            now = time.monotonic()
+            if (not force and self._checked_at is not None
+                    and now - self._checked_at < self.head_check_interval):
+                return
+            self._checked_at = now
+            
+            output = _run_git(['rev-parse', '--verify', '-q', 'HEAD'], self.toplevel, timeout=5)
+            head = output.strip() if output else None
+            if head == self.head:
+                return
+            
+            if (head is not None and self.head is not None and self.commits and _run_git(
+                    ['merge-base', '--is-ancestor', self.head, head], self.toplevel, timeout=30) is not None):
+                new_commits = self._fetch([f'{self.head}..{head}'])
+                if new_commits is None:
+                    return
+                self.commits = new_commits + self.commits
+                self._hashes.update(commit.hash for commit in new_commits)
+            else:
+                # First read, unborn branch or rewritten history: start over
+                self.commits = []
+                self._hashes = set()
+                self.complete = head is None
+            self.head = head
+    
+    def _fetch(self, revisions: List[str]) -> Optional[List[GitCommit]]:
+        """Stream git log for revisions; None if it failed or stalled."""
+        commits = []
+        try:
+            for record in _stream_git_log(revisions, self.toplevel):
+                commit = GitParser._parse_record(record)
+                if commit is not None:
+                    commits.append(commit)
+        except (subprocess.SubprocessError, OSError):
+            return None
+        return commits
+    
+    def _extend(self, count: int) -> bool:
+        """Read the next count commits below the window (caller holds the lock)."""
+        fetched = self._fetch([f'--skip={len(self.commits)}', f'--max-count={count}', self.head])
+        if fetched is None:
+            return False
+        if len(fetched) < count:
+            self.complete = True
+        for commit in fetched:
+            if commit.hash not in self._hashes:
+                self._hashes.add(commit.hash)
+                self.commits.append(commit)
+        return True
+    
+    def query(self, since: Optional[datetime] = None,
+              until: Optional[datetime] = None,
+              max_count: Optional[int] = None) -> List[GitCommit]:
+        """Commits in git log order, filtered like git log --since/--until/--max-count."""
+        since_ts = since.timestamp() if since else None
+        until_ts = until.timestamp() if until else None
+        
+        with self._lock:
+            while True:
+                result = []
+                for commit in self.commits:
+                    if since_ts is not None and commit.committed_at < since_ts:
+                        continue
+                    if until_ts is not None and commit.committed_at > until_ts:
+                        continue
+                    result.append(commit)
+                    if max_count and len(result) >= max_count:
+                        break
+                
+                covered = (
+                    self.head is None
+                    or self.complete
+                    or (max_count and len(result) >= max_count)
+                    or (since_ts is not None and self.commits
+                        and self.commits[-1].committed_at < since_ts)
+                )
+                if covered:
+                    return result
+                
+                # Read deeper: what is still missing, doubling the window at least
+                needed = max_count - len(result) if max_count else 0
+                if not self._extend(max(self.MIN_CHUNK, len(self.commits), needed)):
+                    return result
+
+
 class GitParser:
     """Parse git repository history and extract intelligence."""
     
-    def __init__(self, repo_path: str = None):
-        """Initialize with repository path (defaults to current directory)."""
+    def __init__(self, repo_path: str = None, use_store: bool = True):
+        """
+        Initialize with repository path (defaults to current directory).
+        
+        With use_store, commits come from the CommitStore shared by every
+        parser on the same repository instead of a git log per call.
+        """
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
+        self.use_store = use_store
         
     def is_git_repo(self) -> bool:
-        """Check if the path is a valid git repository."""
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--git-dir'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        """Check if the path is a valid git repository (cached per path)."""
+        return CommitStore.toplevel_for(self.repo_path) is not None
     
     def get_commits(self, since: Optional[datetime] = None, 
                    until: Optional[datetime] = None,
@@ -65,86 +311,101 @@ class GitParser:
         if not self.is_git_repo():
             return []
         
-        cmd = [
-            'git', 'log',
-            '--pretty=format:%H%x00%an%x00%ai%x00%s%x00%b%x00',
-            '--numstat'
-        ]
+        if self.use_store:
+            store = CommitStore.for_path(self.repo_path)
+            store.refresh()
+            return store.query(since=since, until=until, max_count=max_count)
         
+        try:
+            return list(self.iter_commits(since=since, until=until, max_count=max_count))
+        except (subprocess.SubprocessError, OSError):
+            return []
+    
+    def iter_commits(self, since: Optional[datetime] = None,
+                     until: Optional[datetime] = None,
+                     max_count: Optional[int] = None,
+                     idle_timeout: Optional[float] = 30) -> Iterator[GitCommit]:
+        """
+        Yield commits as git log produces them, newest first.
+        
+        Always reads from git rather than the commit store, so memory stays
+        flat on very large histories; for repeated queries use get_commits,
+        which the store serves from memory. There is no overall timeout.
+        Stopping iteration early terminates git.
+        
+        Raises:
+            subprocess.TimeoutExpired: git produced no output for idle_timeout
+                seconds (possibly after some commits were yielded)
+            subprocess.CalledProcessError: git exited non-zero, raised once
+                the output it did produce has been yielded
+        """
+        if not self.is_git_repo():
+            return
+        
+        args = []
         if since:
-            cmd.append(f'--since={since.isoformat()}')
+            args.append(f'--since={since.isoformat()}')
         if until:
-            cmd.append(f'--until={until.isoformat()}')
+            args.append(f'--until={until.isoformat()}')
         if max_count:
-            cmd.append(f'--max-count={max_count}')
+            args.append(f'--max-count={max_count}')
+        
+        for record in _stream_git_log(args, self.repo_path, idle_timeout):
+            commit = self._parse_record(record)
+            if commit is not None:
+                yield commit
+    
+    @staticmethod
+    def _parse_record(entry: str) -> Optional[GitCommit]:
+        """Parse one LOG_FORMAT record (with its numstat lines) into a GitCommit."""
+        parts = entry.lstrip('\x1e').split('\x00', 6)
+        if len(parts) < 6:
+            return None
         
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            hash_val = parts[0].strip()
+            author = parts[1].strip()
+            date_str = parts[2].strip()
+            committed_at = float(parts[3])
+            message = parts[4].strip()
             
-            if result.returncode != 0:
-                return []
-            
-            return self._parse_git_log(result.stdout)
-            
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
-    
-    def _parse_git_log(self, output: str) -> List[GitCommit]:
-        """Parse git log output into GitCommit objects."""
-        commits = []
+            # Parse date
+            date = datetime.fromisoformat(date_str.replace(' ', 'T', 1).rsplit(' ', 1)[0])
+        except (ValueError, IndexError):
+            return None
+        
+        commit = GitCommit(hash_val, author, date, message, committed_at)
         
-        # Split by null separator pattern
-        entries = output.split('\x00\x00')
+        # Parse numstat data (file changes)
+        if len(parts) > 6:
+            for line in parts[6].strip().split('\n'):
+                if not line.strip():
+                    continue
+                stat_parts = line.split('\t')
+                if len(stat_parts) >= 3:
+                    try:
+                        insertions = int(stat_parts[0]) if stat_parts[0] != '-' else 0
+                        deletions = int(stat_parts[1]) if stat_parts[1] != '-' else 0
+                        filename = stat_parts[2]
+                        
+                        commit.insertions += insertions
+                        commit.deletions += deletions
+                        commit.files_changed.append(filename)
+                    except ValueError:
+                        pass
         
-        for entry in entries:
+        return commit
+    
+    @staticmethod
+    def _parse_git_log(output: str) -> List[GitCommit]:
+        """Parse git log output (LOG_FORMAT with --numstat) into GitCommit objects."""
+        commits = []
+        for entry in output.split('\x1e'):
             if not entry.strip():
                 continue
-                
-            parts = entry.split('\x00')
-            if len(parts) < 4:
-                continue
-            
-            try:
-                hash_val = parts[0].strip()
-                author = parts[1].strip()
-                date_str = parts[2].strip()
-                message = parts[3].strip()
-                
-                # Parse date
-                date = datetime.fromisoformat(date_str.replace(' ', 'T', 1).rsplit(' ', 1)[0])
-                
-                commit = GitCommit(hash_val, author, date, message)
-                
-                # Parse numstat data (file changes)
-                if len(parts) > 5:
-                    stat_lines = parts[5].strip().split('\n')
-                    for line in stat_lines:
-                        if not line.strip():
-                            continue
-                        stat_parts = line.split('\t')
-                        if len(stat_parts) >= 3:
-                            try:
-                                insertions = int(stat_parts[0]) if stat_parts[0] != '-' else 0
-                                deletions = int(stat_parts[1]) if stat_parts[1] != '-' else 0
-                                filename = stat_parts[2]
-                                
-                                commit.insertions += insertions
-                                commit.deletions += deletions
-                                commit.files_changed.append(filename)
-                            except ValueError:
-                                pass
-                
+            commit = GitParser._parse_record(entry)
+            if commit is not None:
                 commits.append(commit)
-                
-            except (ValueError, IndexError):
-                continue
-        
         return commits
     
     def get_commit_frequency(self, days: int = 30) -> Dict[str, int]:
@@ -188,31 +449,64 @@ class GitParser:
         Returns:
             List of (date, commit_count) tuples
         """
+        return self.get_commit_velocities([window_days], lookback_days)[window_days]
+    
+    def get_commit_velocities(self, windows: Sequence[int] = (7,),
+                              lookback_days: int = 90) -> Dict[int, List[Tuple[str, int]]]:
+        """
+        Rolling commit counts for several window sizes in one pass.
+        
+        Each day's value counts commits dated within [day - window, day].
+        Commits are binned into a dense per-day array once; every window
+        is then a difference of two prefix sums, so the cost is
+        O(commits + days x windows) regardless of lookback length.
+        
+        Returns:
+            Dict mapping window size to a list of (date, commit_count) tuples
+        """
         since = datetime.now() - timedelta(days=lookback_days)
         commits = self.get_commits(since=since)
         
-        # Group commits by date
-        by_date = {}
-        for commit in commits:
-            date_key = commit.date.strftime('%Y-%m-%d')
-            by_date[date_key] = by_date.get(date_key, 0) + 1
-        
-        # Calculate rolling window
-        velocity = []
         start_date = since.date()
         end_date = datetime.now().date()
+        max_window = max(max(windows), 0)
+        
+        # Day 0 is the earliest day any window can reach back to
+        origin = start_date.toordinal() - max_window
+        n_days = end_date.toordinal() - origin + 1
+        offset = start_date.toordinal() - origin
+        
+        days = [commit.date.toordinal() - origin for commit in commits]
+        if np is not None:
+            days = np.asarray(days, dtype=np.int64)
+            days = days[(days >= 0) & (days < n_days)]
+            prefix = np.zeros(n_days + 1, dtype=np.int64)
+            np.cumsum(np.bincount(days, minlength=n_days), out=prefix[1:])
+            ends = np.arange(offset, n_days) + 1
+        else:
+            counts = [0] * n_days
+            for day in days:
+                if 0 <= day < n_days:
+                    counts[day] += 1
+            prefix = [0]
+            for count in counts:
+                prefix.append(prefix[-1] + count)
+            ends = range(offset + 1, n_days + 1)
+        
+        labels = [
+            datetime.fromordinal(origin + day).date().isoformat()
+            for day in range(offset, n_days)
+        ]
+        
+        velocities = {}
+        for window in windows:
+            if np is not None:
+                values = (prefix[ends] - prefix[np.maximum(ends - window - 1, 0)]).tolist()
+            else:
+                values = [prefix[end] - prefix[max(end - window - 1, 0)] for end in ends]
+            velocities[window] = list(zip(labels, values))
         
-        current = start_date
-        while current <= end_date:
-            window_start = current - timedelta(days=window_days)
-            window_commits = sum(
-                count for date_str, count in by_date.items()
-                if window_start <= datetime.strptime(date_str, '%Y-%m-%d').date() <= current
-            )
-            velocity.append((current.isoformat(), window_commits))
-            current += timedelta(days=1)
-        
-        return velocity
+        return velocities
 
 
 if __name__ == '__main__':
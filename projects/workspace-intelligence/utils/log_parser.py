@@ -5,16 +5,82 @@ Parses Claude session logs and extracts skill usage, patterns, and metrics.
 """
 
 import json
+import os
 import re
-from datetime import datetime
+import sqlite3
+from array import array
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Any, Iterator, List, Dict, Optional, Set, Tuple
 from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to the pure-Python JSONStream
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: InvocationBatch falls back to pure Python
+    np = None
+
+STREAM_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+
+# Skill mention patterns, e.g. "Using skill: X" or "Invoking X"
+SKILL_MENTION_PATTERNS = [
+    r'skill[:\s]+([a-z_-]+)',
+    r'invoke[d]?\s+([a-z_-]+)',
+    r'using\s+([a-z_-]+)\s+skill',
+    r'@([a-z_-]+)\s+skill'
+]
+
+# Compiled once. Kept as separate scans: each gets sre's first-character
+# fast search, which a combined alternation (one pass) loses; the single
+# pass measured about 2x slower on session text.
+_SKILL_MENTION_RES = [re.compile(pattern, re.IGNORECASE) for pattern in SKILL_MENTION_PATTERNS]
+
+
+def find_skill_mentions(content: str) -> List[str]:
+    """Skill names mentioned in content, pattern by pattern, left to right."""
+    return [
+        match.group(1)
+        for regex in _SKILL_MENTION_RES
+        for match in regex.finditer(content)
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp (cached); None if it is not one."""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse a log timestamp, falling back to the current time."""
+    if value:
+        try:
+            timestamp = _parse_iso_timestamp(value)
+        except TypeError:  # unhashable
+            timestamp = None
+        if timestamp is not None:
+            return timestamp
+    # Not cached: the fallback must be "now" at every call
+    return datetime.now()
 
 
 class SkillInvocation:
     """Represents a single skill invocation."""
     
+    __slots__ = ('skill_name', 'timestamp', 'session_id', 'success', 'context')
+    
     def __init__(self, skill_name: str, timestamp: datetime, 
                  session_id: Optional[str] = None,
                  success: bool = True, context: Optional[str] = None):
@@ -28,18 +94,472 @@ class SkillInvocation:
         return f"<SkillInvocation {self.skill_name} @ {self.timestamp}>"
 
 
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DAY_US = 86400 * 10**6
+
+
+class InvocationBatch:
+    """
+    Columnar store of skill invocations for analytics.
+    
+    Columns: interned skill ids, interned session ids, timestamps as
+    integer microseconds since the epoch (UTC for aware timestamps, wall
+    clock for naive ones) with an interned tzinfo id, and success bits.
+    Contexts are not kept. Group-bys use NumPy when it is installed.
+    """
+    
+    def __init__(self):
+        self.skill_names: List[str] = []
+        self.session_names: List[Optional[str]] = []
+        self.tzinfos: List[Optional[Any]] = [None]
+        self.skill_ids = array('I')
+        self.session_ids = array('I')
+        self.epoch_us = array('q')
+        self.tz_ids = array('H')
+        self.success = bytearray()
+        self._skill_index: Dict[str, int] = {}
+        self._session_index: Dict[Optional[str], int] = {}
+        self._tz_index: Dict[Any, int] = {None: 0}
+    
+    def __len__(self) -> int:
+        return len(self.skill_ids)
+    
+    def append(self, skill_name: str, timestamp: datetime,
+               session_id: Optional[str] = None, success: bool = True):
+        """Add one invocation."""
+        skill_id = self._skill_index.get(skill_name)
+        if skill_id is None:
+            skill_id = self._skill_index[skill_name] = len(self.skill_names)
+            self.skill_names.append(skill_name)
+        
+        session = self._session_index.get(session_id)
+        if session is None:
+            session = self._session_index[session_id] = len(self.session_names)
+            self.session_names.append(session_id)
+        
+        tz = timestamp.tzinfo
+        tz_id = self._tz_index.get(tz)
+        if tz_id is None:
+            tz_id = self._tz_index[tz] = len(self.tzinfos)
+            self.tzinfos.append(tz)
+        
+        epoch = _EPOCH if tz is None else _EPOCH_UTC
+        self.skill_ids.append(skill_id)
+        self.session_ids.append(session)
+        self.epoch_us.append((timestamp - epoch) // timedelta(microseconds=1))
+        self.tz_ids.append(tz_id)
+        self.success.append(1 if success else 0)
+    
+    @classmethod
+    def from_invocations(cls, invocations: List[SkillInvocation]) -> 'InvocationBatch':
+        batch = cls()
+        for inv in invocations:
+            batch.append(inv.skill_name, inv.timestamp, inv.session_id, inv.success)
+        return batch
+    
+    @classmethod
+    def from_records(cls, records: List[tuple]) -> 'InvocationBatch':
+        """Build from compact (skill, iso timestamp, session, success, context) records."""
+        batch = cls()
+        for skill_name, timestamp, session_id, success, _ in records:
+            batch.append(skill_name, _parse_iso_timestamp(timestamp), session_id, success)
+        return batch
+    
+    def timestamp(self, row: int) -> datetime:
+        """Rebuild the original timestamp of a row."""
+        tz = self.tzinfos[self.tz_ids[row]]
+        delta = timedelta(microseconds=self.epoch_us[row])
+        if tz is None:
+            return _EPOCH + delta
+        return (_EPOCH_UTC + delta).astimezone(tz)
+    
+    def _day_numbers(self) -> List[int]:
+        """Local calendar day (days since 1970-01-01) of every row."""
+        offsets = [
+            0 if tz is None else tz.utcoffset(None) // timedelta(microseconds=1)
+            for tz in self.tzinfos
+        ]
+        if np is not None:
+            wall = (np.frombuffer(self.epoch_us, dtype=np.int64)
+                    + np.asarray(offsets, dtype=np.int64)[np.frombuffer(self.tz_ids, dtype=np.uint16)])
+            return (wall // _DAY_US).tolist()
+        return [(us + offsets[tz_id]) // _DAY_US for us, tz_id in zip(self.epoch_us, self.tz_ids)]
+    
+    def daily_counts(self) -> Dict[str, int]:
+        """Invocations per calendar day ('%Y-%m-%d' of each timestamp)."""
+        counts = defaultdict(int)
+        for day in self._day_numbers():
+            counts[day] += 1
+        epoch_date = _EPOCH.date()
+        return {
+            (epoch_date + timedelta(days=day)).isoformat(): count
+            for day, count in sorted(counts.items())
+        }
+    
+    def skill_stats(self) -> Dict[str, Dict]:
+        """
+        Per-skill aggregates.
+        
+        Returns:
+            Dict mapping skill_name to count, success_count, session_count
+            and the rows of the first and last use (earliest row on ties)
+        """
+        n_skills = len(self.skill_names)
+        if not len(self):
+            return {}
+        
+        if np is not None:
+            skills = np.frombuffer(self.skill_ids, dtype=np.uint32)
+            sessions = np.frombuffer(self.session_ids, dtype=np.uint32).astype(np.int64)
+            epoch = np.frombuffer(self.epoch_us, dtype=np.int64)
+            success = np.frombuffer(bytes(self.success), dtype=np.uint8)
+            rows = np.arange(len(self))
+            
+            counts = np.bincount(skills, minlength=n_skills)
+            successes = np.bincount(skills, weights=success, minlength=n_skills)
+            
+            # Earliest row among the minimum / maximum timestamps per skill
+            by_first = np.lexsort((rows, epoch, skills))
+            by_last = np.lexsort((rows, -epoch, skills))
+            group_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            present = counts > 0
+            first_rows = np.zeros(n_skills, dtype=np.int64)
+            last_rows = np.zeros(n_skills, dtype=np.int64)
+            first_rows[present] = by_first[group_starts[present]]
+            last_rows[present] = by_last[group_starts[present]]
+            
+            valid = np.array([bool(name) for name in self.session_names], dtype=bool)[sessions]
+            pairs = np.unique(skills[valid].astype(np.int64) * len(self.session_names) + sessions[valid])
+            session_counts = np.bincount(pairs // len(self.session_names), minlength=n_skills)
+            
+            return {
+                name: {
+                    'count': int(counts[i]),
+                    'success_count': int(successes[i]),
+                    'session_count': int(session_counts[i]),
+                    'first_row': int(first_rows[i]),
+                    'last_row': int(last_rows[i])
+                }
+                for i, name in enumerate(self.skill_names)
+            }
+        
+        counts = [0] * n_skills
+        successes = [0] * n_skills
+        first_rows = [-1] * n_skills
+        last_rows = [-1] * n_skills
+        sessions = [set() for _ in range(n_skills)]
+        epoch = self.epoch_us
+        session_names = self.session_names
+        
+        for row, (skill, session, success) in enumerate(zip(self.skill_ids, self.session_ids, self.success)):
+            counts[skill] += 1
+            successes[skill] += success
+            us = epoch[row]
+            if first_rows[skill] < 0 or us < epoch[first_rows[skill]]:
+                first_rows[skill] = row
+            if last_rows[skill] < 0 or us > epoch[last_rows[skill]]:
+                last_rows[skill] = row
+            if session_names[session]:
+                sessions[skill].add(session)
+        
+        return {
+            name: {
+                'count': counts[i],
+                'success_count': successes[i],
+                'session_count': len(sessions[i]),
+                'first_row': first_rows[i],
+                'last_row': last_rows[i]
+            }
+            for i, name in enumerate(self.skill_names)
+        }
+
+
+def _to_record(inv: SkillInvocation) -> tuple:
+    """Compact, cheaply pickled form of an invocation."""
+    return (inv.skill_name, inv.timestamp.isoformat(), inv.session_id,
+            int(bool(inv.success)), inv.context)
+
+
+def _from_record(record: tuple) -> SkillInvocation:
+    """Rebuild an invocation from its compact record."""
+    skill_name, timestamp, session_id, success, context = record
+    return SkillInvocation(
+        skill_name=skill_name,
+        timestamp=datetime.fromisoformat(timestamp),
+        session_id=session_id,
+        success=bool(success),
+        context=context
+    )
+
+
+def _parse_shard(workspace_path: str, stream_threshold: int,
+                 paths: List[str]) -> List[Tuple[str, float, int, List[tuple]]]:
+    """Process-pool worker: parse session files into compact records."""
+    parser = LogParser(workspace_path, use_index=False, stream_threshold=stream_threshold)
+    results = []
+    for path in paths:
+        file = Path(path)
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            continue
+        records = [_to_record(inv) for inv in parser.parse_session_file(file)]
+        results.append((path, stat.st_mtime, stat.st_size, records))
+    return results
+
+
+class JSONStream:
+    """
+    Incremental reader for one JSON document.
+    
+    Values are decoded one at a time with JSONDecoder.raw_decode over a
+    sliding buffer, so memory is bounded by the largest single value read
+    rather than the whole document.
+    """
+    
+    def __init__(self, f, chunk_size: int = 1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+    
+    def _fill(self) -> bool:
+        """Read more input, growing reads for values larger than a chunk."""
+        if self.eof:
+            return False
+        rest = self.buf[self.pos:]
+        chunk = self.f.read(max(self.chunk_size, len(rest)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = rest + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, char: str):
+        """Consume one structural character."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A complete value is followed by whitespace or structure;
+                # anything else (or the buffer end) may be a cut-off number
+                if self.eof or (end < len(self.buf) and self.buf[end] in ' \t\r\n,]}:'):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+    
+    def skip(self):
+        """Skip the next value without building large containers."""
+        char = self.peek()
+        if char == '[':
+            for _ in self.iter_array():
+                pass
+        elif char == '{':
+            for _ in self.iter_object_keys():
+                self.skip()
+        else:
+            self.value()
+    
+    def iter_array(self) -> Iterator[Any]:
+        """Yield the items of the array at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' or ']'", self.buf, self.pos - 1)
+    
+    def iter_object_keys(self) -> Iterator[str]:
+        """
+        Yield the keys of the object at the current position.
+        
+        The caller must consume each key's value (value() or iter_array())
+        before asking for the next key.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' or '}'", self.buf, self.pos - 1)
+
+
+class InvocationIndex:
+    """
+    Persistent SQLite index of parsed skill invocations.
+    
+    Rows are keyed by session file path and remembered with the file's
+    mtime and size, so only new or changed session files are re-parsed.
+    Bump PARSER_VERSION whenever extraction changes to invalidate the index.
+    """
+    
+    PARSER_VERSION = 1
+    
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS files ('
+                'path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS invocations ('
+                'path TEXT NOT NULL, seq INTEGER NOT NULL, skill_name TEXT NOT NULL, '
+                'timestamp TEXT NOT NULL, session_id TEXT, success INTEGER NOT NULL, '
+                'context TEXT, PRIMARY KEY (path, seq))'
+            )
+            
+            row = conn.execute("SELECT value FROM meta WHERE key = 'parser_version'").fetchone()
+            if row is None or int(row[0]) != self.PARSER_VERSION:
+                conn.execute('DELETE FROM invocations')
+                conn.execute('DELETE FROM files')
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('parser_version', ?)",
+                    (str(self.PARSER_VERSION),)
+                )
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection that waits on other writers; commits on success, always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def stale_files(self, files: List[Path]) -> List[Path]:
+        """Files that are new or changed since they were indexed."""
+        with self._connect() as conn:
+            known = {
+                path: (mtime, size)
+                for path, mtime, size in conn.execute('SELECT path, mtime, size FROM files')
+            }
+        
+        stale = []
+        for file in files:
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            if known.get(str(file)) != (stat.st_mtime, stat.st_size):
+                stale.append(file)
+        return stale
+    
+    def store(self, parsed: Dict[str, Tuple[float, int, List[tuple]]]):
+        """Replace the records of parsed files: path -> (mtime, size, records)."""
+        with self._connect() as conn:
+            for path, (mtime, size, records) in parsed.items():
+                conn.execute('DELETE FROM invocations WHERE path = ?', (path,))
+                conn.executemany(
+                    'INSERT INTO invocations VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    ((path, seq) + tuple(record) for seq, record in enumerate(records))
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO files (path, mtime, size) VALUES (?, ?, ?)',
+                    (path, mtime, size)
+                )
+    
+    def load(self, files: List[Path]) -> List[tuple]:
+        """Invocation records for files, in file order."""
+        records = []
+        with self._connect() as conn:
+            for file in files:
+                # Primary key order: no sort needed
+                records.extend(conn.execute(
+                    'SELECT skill_name, timestamp, session_id, success, context '
+                    'FROM invocations WHERE path = ? ORDER BY seq',
+                    (str(file),)
+                ))
+        return records
+    
+    def prune(self, existing: List[Path]):
+        """Drop entries for session files that no longer exist."""
+        keep = {str(file) for file in existing}
+        with self._connect() as conn:
+            stale = [(path,) for (path,) in conn.execute('SELECT path FROM files') if path not in keep]
+            conn.executemany('DELETE FROM invocations WHERE path = ?', stale)
+            conn.executemany('DELETE FROM files WHERE path = ?', stale)
+
+
 class LogParser:
     """Parse Claude logs and session files for intelligence extraction."""
     
-    def __init__(self, workspace_path: str):
-        """Initialize with workspace path."""
+    def __init__(self, workspace_path: str, use_index: bool = True,
+                 stream_threshold: int = 32 * 1024 * 1024, workers: int = 1):
+        """
+        Initialize with workspace path.
+        
+        With use_index, parsed invocations are cached in
+        .claude/cache/skill-invocations.db and only new or changed
+        session files are parsed again. JSON session files larger than
+        stream_threshold bytes are parsed incrementally. With workers > 1
+        (0 = one per CPU), session files are parsed on a process pool.
+        """
         self.workspace_path = Path(workspace_path)
         self.claude_dir = self.workspace_path / '.claude'
         self.sessions_dir = self.claude_dir / 'sessions'
         self.logs_dir = self.claude_dir / 'logs'
+        self.use_index = use_index
+        self.stream_threshold = stream_threshold
+        self.workers = workers or os.cpu_count() or 1
+        self._index = None
+    
+    def _get_index(self) -> Optional[InvocationIndex]:
+        """Open the invocation index, or None if it can't be used."""
+        if not self.use_index:
+            return None
+        if self._index is None:
+            try:
+                self._index = InvocationIndex(self.claude_dir / 'cache' / 'skill-invocations.db')
+            except (sqlite3.Error, OSError):
+                self.use_index = False
+                return None
+        return self._index
     
     def find_session_files(self, days: Optional[int] = None) -> List[Path]:
-        """Find all session files, optionally filtered by age."""
+        """Find all session files (.json and .jsonl), optionally filtered by age."""
         if not self.sessions_dir.exists():
             return []
         
@@ -50,10 +570,11 @@ class LogParser:
             from datetime import timedelta
             cutoff_time = datetime.now().timestamp() - (days * 86400)
         
-        for file in self.sessions_dir.rglob('*.json'):
-            if cutoff_time and file.stat().st_mtime < cutoff_time:
-                continue
-            files.append(file)
+        for pattern in ('*.json', '*.jsonl'):
+            for file in self.sessions_dir.rglob(pattern):
+                if cutoff_time and file.stat().st_mtime < cutoff_time:
+                    continue
+                files.append(file)
         
         return sorted(files, key=lambda f: f.stat().st_mtime, reverse=True)
     
@@ -76,56 +597,111 @@ class LogParser:
         
         return sorted(files, key=lambda f: f.stat().st_mtime, reverse=True)
     
-    def parse_session_file(self, file_path: Path) -> List[SkillInvocation]:
-        """Parse a single session file for skill invocations."""
+    def parse_session_file(self, file_path: Path, stream: Optional[bool] = None) -> List[SkillInvocation]:
+        """
+        Parse a single session file for skill invocations.
+        
+        stream=None streams JSON files above stream_threshold; JSONL files
+        are always read line by line.
+        """
+        session_id = file_path.stem
         invocations = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if stream is None:
+                stream = file_path.stat().st_size > self.stream_threshold
             
-            session_id = file_path.stem
-            
-            # Look for skill invocations in various formats
-            # This is a flexible parser that adapts to different log structures
-            
-            if isinstance(data, dict):
-                # Extract from messages or events
-                messages = data.get('messages', [])
-                events = data.get('events', [])
-                
-                for msg in messages:
-                    invocations.extend(self._extract_skills_from_message(msg, session_id))
-                
-                for event in events:
-                    invocations.extend(self._extract_skills_from_event(event, session_id))
-            
-            elif isinstance(data, list):
-                # Array of messages/events
-                for item in data:
+            for kind, item in self.iter_session_items(file_path, stream=stream):
+                if not isinstance(item, dict):
+                    continue
+                if kind == 'event':
+                    invocations.extend(self._extract_skills_from_event(item, session_id))
+                else:
                     invocations.extend(self._extract_skills_from_message(item, session_id))
         
-        except (json.JSONDecodeError, IOError, KeyError):
+        except STREAM_ERRORS + (IOError, KeyError):
             # Silently skip malformed files
-            pass
+            return []
         
         return invocations
     
+    def iter_session_items(self, file_path: Path, stream: bool = True) -> Iterator[Tuple[str, Dict]]:
+        """
+        Yield ('message' | 'event', item) from a session file.
+        
+        Handles {"messages": [...], "events": [...]} objects, top-level
+        message arrays, and JSONL (one message per line; lines whose type
+        mentions a skill are events). Malformed JSONL lines are skipped.
+        """
+        if file_path.suffix == '.jsonl':
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(item, dict) and 'skill' in str(item.get('type', '')).lower():
+                        yield 'event', item
+                    else:
+                        yield 'message', item
+            return
+        
+        if not stream:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                for msg in data.get('messages', []):
+                    yield 'message', msg
+                for event in data.get('events', []):
+                    yield 'event', event
+            elif isinstance(data, list):
+                for item in data:
+                    yield 'message', item
+            return
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            first = JSONStream(f).peek()
+        
+        if first == '[':
+            for item in self._stream_array(file_path, None):
+                yield 'message', item
+        elif first == '{':
+            # Two passes keep the messages-then-events order without buffering
+            for msg in self._stream_array(file_path, 'messages'):
+                yield 'message', msg
+            for event in self._stream_array(file_path, 'events'):
+                yield 'event', event
+        else:
+            raise json.JSONDecodeError('Expecting object or array', first, 0)
+    
+    def _stream_array(self, file_path: Path, key: Optional[str]) -> Iterator[Any]:
+        """Stream the top-level array, or the array under a top-level key."""
+        if ijson is not None:
+            with open(file_path, 'rb') as f:
+                # use_float: numbers as float, like json.load (default is Decimal)
+                yield from ijson.items(f, f'{key}.item' if key else 'item', use_float=True)
+            return
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            stream = JSONStream(f)
+            if key is None:
+                yield from stream.iter_array()
+                return
+            for name in stream.iter_object_keys():
+                if name == key and stream.peek() == '[':
+                    yield from stream.iter_array()
+                    return
+                stream.skip()
+    
     def _extract_skills_from_message(self, msg: Dict, session_id: str) -> List[SkillInvocation]:
         """Extract skill invocations from a message object."""
         invocations = []
         
         # Look for tool calls, function calls, skill references
         content = msg.get('content', '')
-        timestamp_str = msg.get('timestamp', msg.get('created_at'))
-        
-        if timestamp_str:
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            except:
-                timestamp = datetime.now()
-        else:
-            timestamp = datetime.now()
+        timestamp = parse_timestamp(msg.get('timestamp', msg.get('created_at')))
         
         # Check for tool_calls field
         tool_calls = msg.get('tool_calls', [])
@@ -141,24 +717,14 @@ class LogParser:
         
         # Parse content for skill mentions
         if isinstance(content, str):
-            # Look for patterns like "Using skill: X" or "Invoking X"
-            patterns = [
-                r'skill[:\s]+([a-z_-]+)',
-                r'invoke[d]?\s+([a-z_-]+)',
-                r'using\s+([a-z_-]+)\s+skill',
-                r'@([a-z_-]+)\s+skill'
-            ]
-            
-            for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    skill_name = match.group(1)
-                    invocations.append(SkillInvocation(
-                        skill_name=skill_name,
-                        timestamp=timestamp,
-                        session_id=session_id,
-                        context=content[:200]
-                    ))
+            context = content[:200]
+            for skill_name in find_skill_mentions(content):
+                invocations.append(SkillInvocation(
+                    skill_name=skill_name,
+                    timestamp=timestamp,
+                    session_id=session_id,
+                    context=context
+                ))
         
         return invocations
     
@@ -167,15 +733,7 @@ class LogParser:
         invocations = []
         
         event_type = event.get('type', '')
-        timestamp_str = event.get('timestamp')
-        
-        if timestamp_str:
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            except:
-                timestamp = datetime.now()
-        else:
-            timestamp = datetime.now()
+        timestamp = parse_timestamp(event.get('timestamp'))
         
         if 'skill' in event_type.lower():
             skill_name = event.get('skill', event.get('name'))
@@ -195,11 +753,110 @@ class LogParser:
         
         session_files = self.find_session_files(days=days)
         
+        records = self._load_records(session_files, prune=days is None)
+        if records is not None:
+            return [_from_record(record) for record in records]
+        
         for file in session_files:
             invocations.extend(self.parse_session_file(file))
         
         return invocations
     
+    def get_invocation_batch(self, days: Optional[int] = None) -> InvocationBatch:
+        """Get all skill invocations from session files as a columnar batch."""
+        session_files = self.find_session_files(days=days)
+        
+        records = self._load_records(session_files, prune=days is None)
+        if records is not None:
+            return InvocationBatch.from_records(records)
+        
+        batch = InvocationBatch()
+        for file in session_files:
+            for inv in self.parse_session_file(file):
+                batch.append(inv.skill_name, inv.timestamp, inv.session_id, inv.success)
+        return batch
+    
+    def _load_records(self, session_files: List[Path], prune: bool = False) -> Optional[List[tuple]]:
+        """
+        Compact records for session files via the index or process pool.
+        
+        Returns None when neither applies and files should be parsed
+        in-process one by one.
+        """
+        if not session_files:
+            return []
+        
+        index = self._get_index()
+        if index is not None:
+            try:
+                index.store(self.parse_session_files(index.stale_files(session_files)))
+                records = index.load(session_files)
+                if prune:
+                    index.prune(session_files)
+                return records
+            except sqlite3.Error:
+                pass
+        
+        if self.workers > 1 and len(session_files) > 1:
+            parsed = self.parse_session_files(session_files)
+            return [
+                record
+                for file in session_files
+                for record in parsed.get(str(file), (0, 0, []))[2]
+            ]
+        
+        return None
+    
+    def parse_session_files(self, files: List[Path]) -> Dict[str, Tuple[float, int, List[tuple]]]:
+        """
+        Parse many session files into compact records.
+        
+        Returns path -> (mtime, size, records), where each record is
+        (skill_name, iso_timestamp, session_id, success, context). With
+        workers > 1 the files are sharded across a process pool; shards are
+        balanced by file size and merged by path, so the result does not
+        depend on scheduling.
+        """
+        paths = [str(file) for file in files]
+        if self.workers <= 1 or len(paths) <= 1:
+            shards = [paths]
+        else:
+            n_shards = min(len(paths), self.workers * 4)
+            shards = [[] for _ in range(n_shards)]
+            loads = [0] * n_shards
+            sizes = {}
+            for path in paths:
+                try:
+                    sizes[path] = os.path.getsize(path)
+                except OSError:
+                    sizes[path] = 0
+            # Largest files first onto the least loaded shard
+            for path in sorted(paths, key=lambda p: (-sizes[p], p)):
+                target = loads.index(min(loads))
+                shards[target].append(path)
+                loads[target] += sizes[path]
+        
+        parsed = {}
+        if len(shards) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(shards))) as pool:
+                    for results in pool.map(
+                        _parse_shard,
+                        [str(self.workspace_path)] * len(shards),
+                        [self.stream_threshold] * len(shards),
+                        shards
+                    ):
+                        for path, mtime, size, records in results:
+                            parsed[path] = (mtime, size, records)
+                return parsed
+            except (BrokenProcessPool, OSError):
+                parsed = {}
+        
+        for path, mtime, size, records in _parse_shard(
+                str(self.workspace_path), self.stream_threshold, paths):
+            parsed[path] = (mtime, size, records)
+        return parsed
+    
     def get_skill_usage_stats(self, days: Optional[int] = None) -> Dict[str, Dict]:
         """
         Get aggregated skill usage statistics.
@@ -207,44 +864,19 @@ class LogParser:
         Returns:
             Dict mapping skill_name to stats (count, last_used, success_rate)
         """
-        invocations = self.get_all_skill_invocations(days=days)
-        
-        stats = defaultdict(lambda: {
-            'count': 0,
-            'last_used': None,
-            'first_used': None,
-            'success_count': 0,
-            'failure_count': 0,
-            'sessions': set()
-        })
-        
-        for inv in invocations:
-            skill = stats[inv.skill_name]
-            skill['count'] += 1
-            
-            if inv.success:
-                skill['success_count'] += 1
-            else:
-                skill['failure_count'] += 1
-            
-            if skill['last_used'] is None or inv.timestamp > skill['last_used']:
-                skill['last_used'] = inv.timestamp
-            
-            if skill['first_used'] is None or inv.timestamp < skill['first_used']:
-                skill['first_used'] = inv.timestamp
-            
-            if inv.session_id:
-                skill['sessions'].add(inv.session_id)
-        
-        # Convert sets to counts and datetimes to ISO strings
+        return self._usage_stats(self.get_invocation_batch(days=days))
+    
+    @staticmethod
+    def _usage_stats(batch: InvocationBatch) -> Dict[str, Dict]:
+        """Usage statistics from a batch's per-skill group-by."""
         result = {}
-        for skill_name, data in stats.items():
+        for skill_name, data in batch.skill_stats().items():
             result[skill_name] = {
                 'count': data['count'],
-                'last_used': data['last_used'].isoformat() if data['last_used'] else None,
-                'first_used': data['first_used'].isoformat() if data['first_used'] else None,
+                'last_used': batch.timestamp(data['last_row']).isoformat(),
+                'first_used': batch.timestamp(data['first_row']).isoformat(),
                 'success_rate': data['success_count'] / data['count'] if data['count'] > 0 else 0,
-                'session_count': len(data['sessions'])
+                'session_count': data['session_count']
             }
         
         return result
@@ -274,20 +906,17 @@ class LogParser:
             List of (skill_name, last_used_timestamp) tuples
         """
         installed = self.find_installed_skills()
-        usage_stats = self.get_skill_usage_stats(days=days)
+        batch = self.get_invocation_batch(days=days)
+        usage = batch.skill_stats()
         
         underutilized = []
         
         for skill in installed:
-            if skill not in usage_stats:
+            if skill not in usage:
                 # Never used
                 underutilized.append((skill, None))
-            else:
-                stats = usage_stats[skill]
-                if stats['count'] < 3:  # Used fewer than 3 times
-                    last_used_str = stats.get('last_used')
-                    last_used = datetime.fromisoformat(last_used_str) if last_used_str else None
-                    underutilized.append((skill, last_used))
+            elif usage[skill]['count'] < 3:  # Used fewer than 3 times
+                underutilized.append((skill, batch.timestamp(usage[skill]['last_row'])))
         
         return sorted(underutilized, key=lambda x: x[1] if x[1] else datetime.min)
 
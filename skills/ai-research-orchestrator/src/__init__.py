@@ -7,11 +7,15 @@ Orchestrates AI research workflows using RLM-inspired patterns.
 from .orchestrator import (
     AIReseachOrchestrator,
     RecursiveOrchestrator,
+    CompletionEvaluator,
+    ResultStore,
     ExecutionResult,
     ResearchTask,
     PatternLibrary,
     SkillRegistry,
     ExecutionFeedback,
+    ResearchCache,
+    JSONLWriter,
     create_orchestrator
 )
 
@@ -19,10 +23,14 @@ __version__ = "1.0.0"
 __all__ = [
     "AIReseachOrchestrator",
     "RecursiveOrchestrator", 
+    "CompletionEvaluator",
+    "ResultStore",
     "ExecutionResult",
     "ResearchTask",
     "PatternLibrary",
     "SkillRegistry",
     "ExecutionFeedback",
+    "ResearchCache",
+    "JSONLWriter",
     "create_orchestrator"
 ]
@@ -8,13 +8,36 @@ Orchestrates AI research workflows using RLM-inspired patterns:
 - Recursive orchestration
 """
 
+import os
+import copy
 import json
+import stat
 import time
+import queue
+import shutil
+import atexit
+import hashlib
+import sqlite3
+import tempfile
+import uuid
+import threading
+import concurrent.futures
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
-from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class Complexity(Enum):
     """Task complexity levels."""
@@ -53,35 +76,347 @@ class ResearchTask:
         }
 
 
+@contextmanager
+def _file_lock(path: Path):
+    """Hold an exclusive advisory lock on a sidecar .lock file."""
+    lock_path = path.with_name(path.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _atomic_write_json(path: Path, data: dict, indent: int = 2):
+    """Write JSON to a temp file and rename it over the target, keeping its mode."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; give the file the mode open() would have
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _rotated_segments(path: Path) -> list[tuple[int, Path]]:
+    """Rotated segments of a log (<name>.1, <name>.2, ...), oldest first."""
+    segments = []
+    for candidate in path.parent.glob(path.name + ".*"):
+        suffix = candidate.name[len(path.name) + 1:]
+        if suffix.isdigit():
+            segments.append((int(suffix), candidate))
+    return sorted(segments)
+
+
+class JSONLWriter:
+    """
+    Buffered JSONL appender with a background flush thread.
+    
+    Records go through a bounded queue (writers block when it is full) and
+    are appended in batches, one write per batch of complete lines, under a
+    file lock. fsync policy: "none", "interval" (at most every
+    fsync_interval seconds) or "always" (every batch). When the file would
+    exceed max_bytes it is renamed to the next <name>.N segment.
+    
+    A failed batch is dropped and its error is raised from the next
+    write() or flush(); the thread keeps running. on_batch, if given, is
+    called on the flush thread with the number of records handled after
+    every batch, written or dropped.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+        flush_interval: float = 0.5,
+        max_queue: int = 10000,
+        max_batch: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        on_batch: Callable[[int], None] = None
+    ):
+        if fsync not in ("none", "interval", "always"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path = Path(path)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_bytes = max_bytes
+        self.on_batch = on_batch
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+        self._error: OSError | None = None
+        atexit.register(self.close)
+    
+    def write(self, record: dict):
+        """Queue one record for appending."""
+        if self._closed:
+            raise ValueError("Writer is closed")
+        self._raise_error()
+        self._ensure_thread()
+        self._queue.put(json.dumps(record) + "\n")
+    
+    def flush(self):
+        """Block until every queued record has been handled by a live writer thread."""
+        if self._thread is not None:
+            with self._queue.all_tasks_done:
+                while self._queue.unfinished_tasks and self._thread.is_alive():
+                    self._queue.all_tasks_done.wait(timeout=self.flush_interval)
+        self._raise_error()
+    
+    def close(self):
+        """Flush remaining records and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+    
+    def _raise_error(self):
+        """Raise (once) the error of the last failed batch."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+    
+    def _ensure_thread(self):
+        """Start the flush thread on first write (or if it has died)."""
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="jsonl-writer", daemon=True)
+                    self._thread.start()
+    
+    def _run(self):
+        """Drain the queue in batches until closed."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._unsynced and self.fsync == "interval":
+                    try:
+                        self._sync_idle()
+                    except OSError as e:
+                        self._error = e
+                        self._unsynced = False
+                continue
+            
+            batch = [first]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    self._write_batch("".join(lines))
+            except OSError as e:
+                self._error = e
+            finally:
+                if lines and self.on_batch is not None:
+                    try:
+                        self.on_batch(len(lines))
+                    except OSError as e:
+                        self._error = e
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if None in batch:
+                return
+    
+    def _write_batch(self, data: str):
+        """Append complete lines in one write, rotating first if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.path):
+            if self.path.exists() and self.path.stat().st_size + len(data) > self.max_bytes:
+                self._rotate()
+            
+            with open(self.path, "a") as f:
+                f.write(data)
+                f.flush()
+                now = time.monotonic()
+                if self.fsync == "always" or (
+                    self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval
+                ):
+                    os.fsync(f.fileno())
+                    self._last_fsync = now
+                    self._unsynced = False
+                else:
+                    self._unsynced = self.fsync != "none"
+    
+    def _sync_idle(self):
+        """fsync pending data once writes go quiet."""
+        if self.path.exists():
+            with open(self.path, "a") as f:
+                os.fsync(f.fileno())
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+    
+    def _rotate(self):
+        """Rename the active file to the next numbered segment (caller holds the lock)."""
+        segments = _rotated_segments(self.path)
+        next_number = segments[-1][0] + 1 if segments else 1
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.{next_number}"))
+
+
+class PatternIndex:
+    """
+    Per-domain trigger index for pattern matching.
+    
+    Holds trigger -> (pattern, trigger) postings for substring matches,
+    word -> (pattern, trigger) postings for word overlap, and pre-tokenized
+    trigger word sets, so a query only touches candidate patterns.
+    """
+    
+    def __init__(self, patterns: list[dict]):
+        self.patterns = patterns
+        self.by_name: dict[str, dict] = {}
+        self.trigger_postings: dict[str, list[tuple[int, int]]] = {}
+        self.word_postings: dict[str, list[tuple[int, int]]] = {}
+        self.trigger_words: dict[tuple[int, int], frozenset] = {}
+        
+        for p_idx, pattern in enumerate(patterns):
+            self.by_name.setdefault(pattern["name"], pattern)
+            for t_idx, trigger in enumerate(pattern.get("triggers", [])):
+                key = (p_idx, t_idx)
+                words = frozenset(trigger.split())
+                self.trigger_words[key] = words
+                self.trigger_postings.setdefault(trigger, []).append(key)
+                for word in words:
+                    self.word_postings.setdefault(word, []).append(key)
+        
+        # Distinct trigger lengths, for enumerating query substrings
+        self.trigger_lengths = sorted({len(t) for t in self.trigger_postings if t})
+        self.longest_first = sorted(self.trigger_postings, key=len, reverse=True)
+    
+    def trigger_scores(self, query: str) -> dict[tuple[int, int], float]:
+        """Score every (pattern, trigger) pair that can match the query."""
+        scores: dict[tuple[int, int], float] = {}
+        
+        # Trigger contained in query: look up query substrings of trigger lengths
+        for start in range(len(query)):
+            for length in self.trigger_lengths:
+                if start + length > len(query):
+                    break
+                for key in self.trigger_postings.get(query[start:start + length], ()):
+                    scores[key] = 0.4
+        
+        # Query contained in trigger: only triggers at least as long as the query
+        for trigger in self.longest_first:
+            if len(trigger) < len(query):
+                break
+            if query in trigger:
+                for key in self.trigger_postings[trigger]:
+                    scores.setdefault(key, 0.3)
+        
+        # Word-level overlap for the remaining triggers
+        overlaps: dict[tuple[int, int], int] = {}
+        for word in set(query.split()):
+            for key in self.word_postings.get(word, ()):
+                if key not in scores:
+                    overlaps[key] = overlaps.get(key, 0) + 1
+        for key, overlap in overlaps.items():
+            scores[key] = 0.1 * overlap
+        
+        return scores
+
+
 class PatternLibrary:
     """
     Externalized pattern storage (RLM Pattern 1).
     
-    Patterns stored in JSON, loaded on-demand.
-    Enables 100+ patterns without working memory limits.
+    Patterns stored in JSON, parsed once and indexed per domain.
+    Matching only scores candidate patterns found through the trigger index,
+    so libraries with thousands of patterns stay cheap to query.
+    
+    Confidence updates are buffered and flushed in batches (every
+    `flush_every` updates, after `flush_interval` seconds, or on flush()).
+    Flushes merge deltas into the file under a lock, so several processes
+    can share one library.
     """
     
-    def __init__(self, patterns_path: str = None):
+    def __init__(
+        self,
+        patterns_path: str = None,
+        flush_every: int = 50,
+        flush_interval: float = 10.0
+    ):
         if patterns_path is None:
             base_path = Path(__file__).parent.parent
             patterns_path = base_path / "patterns" / "pattern-library.json"
         self.patterns_path = Path(patterns_path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._data: dict = {}
         self._loaded_patterns = {}
+        self._indexes: dict[str, PatternIndex] = {}
         self._metadata = {}
-        self._load_metadata()
+        self._structure_version = None
+        
+        # (domain, pattern name) -> [confidence delta, usage delta]
+        self._pending: dict[tuple[str, str], list] = {}
+        self._pending_updates = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        
+        self._load_library()
+        atexit.register(self.flush)
     
-    def _load_metadata(self):
-        """Load pattern metadata without full patterns."""
+    def _load_library(self):
+        """Parse the pattern file once."""
         if self.patterns_path.exists():
             try:
-                data = json.load(open(self.patterns_path))
-                self._metadata = data.get("metadata", {})
+                with open(self.patterns_path) as f:
+                    self._set_data(json.load(f))
             except (json.JSONDecodeError, FileNotFoundError):
                 self._metadata = {}
                 self._initialize_default_patterns()
         else:
             self._initialize_default_patterns()
     
+    def _set_data(self, data: dict):
+        """Install parsed library data; domain indexes are built lazily."""
+        self._data = data
+        self._metadata = data.get("metadata", {})
+        self._loaded_patterns = {}
+        self._indexes = {}
+        self._structure_version = None
+    
+    def _get_index(self, domain: str) -> PatternIndex:
+        """Get (building on first use) the trigger index for a domain."""
+        index = self._indexes.get(domain)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(domain)
+                if index is None:
+                    index = PatternIndex(self.get_patterns(domain))
+                    self._indexes[domain] = index
+        return index
+    
     def _initialize_default_patterns(self):
         """Initialize with default patterns."""
         default_patterns = {
@@ -176,87 +511,125 @@ class PatternLibrary:
         }
         
         # Save default patterns
-        self.patterns_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.patterns_path, "w") as f:
-            json.dump(default_patterns, f, indent=2)
+        with _file_lock(self.patterns_path):
+            _atomic_write_json(self.patterns_path, default_patterns)
         
-        self._metadata = default_patterns.get("metadata", {})
+        self._set_data(default_patterns)
     
     def get_patterns(self, domain: str) -> list[dict]:
-        """Get patterns for a domain (lazy load)."""
+        """Get patterns for a domain."""
         if domain not in self._loaded_patterns:
-            if self.patterns_path.exists():
-                try:
-                    data = json.load(open(self.patterns_path))
-                    self._loaded_patterns[domain] = data.get("domains", {}).get(domain, {}).get("patterns", [])
-                except json.JSONDecodeError:
-                    self._loaded_patterns[domain] = []
-            else:
-                self._loaded_patterns[domain] = []
+            self._loaded_patterns[domain] = self._data.get("domains", {}).get(domain, {}).get("patterns", [])
         return self._loaded_patterns[domain]
     
     def find_matching_patterns(self, query: str, domain: str = "research", max_results: int = 5) -> list[dict]:
-        """Find patterns matching query (metadata-only search)."""
-        patterns = self.get_patterns(domain)
-        query_lower = query.lower()
+        """Find patterns matching query via the domain's trigger index."""
+        index = self._get_index(domain)
+        
+        per_pattern: dict[int, float] = {}
+        for (p_idx, _), score in index.trigger_scores(query.lower()).items():
+            per_pattern[p_idx] = per_pattern.get(p_idx, 0.0) + score
         
         scored = []
-        for pattern in patterns:
-            score = self._compute_match_score(query_lower, pattern)
+        for p_idx, score in per_pattern.items():
+            pattern = index.patterns[p_idx]
+            # Boost by confidence
+            score = min(score * (0.5 + 0.5 * pattern.get("confidence", 0.5)), 1.0)
             if score > 0.2:
-                scored.append((pattern, score))
+                scored.append((score, p_idx))
         
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [p for p, _ in scored[:max_results]]
-    
-    def _compute_match_score(self, query: str, pattern: dict) -> float:
-        """Compute match score based on triggers and confidence."""
-        score = 0.0
-        triggers = pattern.get("triggers", [])
-        
-        for trigger in triggers:
-            if trigger in query:
-                score += 0.4
-            elif query in trigger:
-                score += 0.3
-            else:
-                # Word-level matching
-                query_words = set(query.split())
-                trigger_words = set(trigger.split())
-                overlap = len(query_words & trigger_words)
-                if overlap > 0:
-                    score += 0.1 * overlap
-        
-        # Boost by confidence
-        confidence = pattern.get("confidence", 0.5)
-        score = score * (0.5 + 0.5 * confidence)
-        return min(score, 1.0)
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        return [index.patterns[p_idx] for _, p_idx in scored[:max_results]]
     
     def update_confidence(self, pattern_name: str, success: bool, domain: str = "research"):
-        """Update pattern confidence based on execution outcome."""
-        patterns = self.get_patterns(domain)
-        for pattern in patterns:
-            if pattern["name"] == pattern_name:
+        """Update pattern confidence based on execution outcome (buffered)."""
+        return self.update_confidence_batch([(pattern_name, success)], domain) == 1
+    
+    def update_confidence_batch(
+        self,
+        outcomes: list[tuple[str, bool]],
+        domain: str = "research"
+    ) -> int:
+        """
+        Apply several (pattern_name, success) outcomes under one lock.
+        
+        Returns the number of outcomes applied to known patterns.
+        """
+        by_name = self._get_index(domain).by_name
+        applied = 0
+        
+        with self._lock:
+            for pattern_name, success in outcomes:
+                pattern = by_name.get(pattern_name)
+                if pattern is None:
+                    continue
+                
                 delta = 0.03 if success else -0.05
-                pattern["confidence"] = max(0.1, min(1.0, pattern["confidence"] + delta))
+                old_confidence = pattern["confidence"]
+                pattern["confidence"] = max(0.1, min(1.0, old_confidence + delta))
                 pattern["usage_count"] += 1
-                self._save_patterns(domain)
-                return True
-        return False
+                
+                pending = self._pending.setdefault((domain, pattern_name), [0.0, 0])
+                pending[0] += pattern["confidence"] - old_confidence
+                pending[1] += 1
+                applied += 1
+            
+            self._pending_updates += applied
+            due = applied and (
+                self._pending_updates >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        
+        if due:
+            self.flush()
+        return applied
     
-    def _save_patterns(self, domain: str):
-        """Save patterns back to file."""
-        if self.patterns_path.exists():
-            try:
-                data = json.load(open(self.patterns_path))
-                if domain in data.get("domains", {}):
-                    data["domains"][domain]["patterns"] = self._loaded_patterns[domain]
-                    # Update metadata
-                    total_patterns = sum(len(d.get("patterns", [])) for d in data.get("domains", {}).values())
-                    data["metadata"]["total_patterns"] = total_patterns
-                    json.dump(data, open(self.patterns_path, "w"), indent=2)
-            except json.JSONDecodeError:
-                pass
+    def flush(self):
+        """
+        Merge buffered confidence deltas into the pattern file.
+        
+        Re-reads the file under the lock and applies deltas rather than
+        overwriting, so concurrent processes don't lose each other's updates.
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending or not self.patterns_path.exists():
+                return
+            
+            with _file_lock(self.patterns_path):
+                try:
+                    with open(self.patterns_path) as f:
+                        data = json.load(f)
+                except json.JSONDecodeError:
+                    return
+                
+                domains = data.get("domains", {})
+                on_disk = {
+                    (domain, pattern["name"]): pattern
+                    for domain, info in domains.items()
+                    for pattern in info.get("patterns", [])
+                }
+                for key, (delta, uses) in self._pending.items():
+                    pattern = on_disk.get(key)
+                    if pattern is not None:
+                        pattern["confidence"] = max(0.1, min(1.0, pattern.get("confidence", 0.5) + delta))
+                        pattern["usage_count"] = pattern.get("usage_count", 0) + uses
+                
+                total_patterns = sum(len(d.get("patterns", [])) for d in domains.values())
+                data.setdefault("metadata", {})["total_patterns"] = total_patterns
+                _atomic_write_json(self.patterns_path, data)
+            
+            self._pending = {}
+            self._pending_updates = 0
+            
+            # Pick up other processes' updates without re-indexing
+            for domain, patterns in self._loaded_patterns.items():
+                for pattern in patterns:
+                    merged = on_disk.get((domain, pattern["name"]))
+                    if merged is not None:
+                        pattern["confidence"] = merged.get("confidence", pattern["confidence"])
+                        pattern["usage_count"] = merged.get("usage_count", pattern["usage_count"])
+            self._metadata = data.get("metadata", self._metadata)
     
     def get_metadata(self) -> dict:
         """Get pattern library metadata."""
@@ -264,13 +637,26 @@ class PatternLibrary:
     
     def get_all_domains(self) -> list[str]:
         """Get all available domains."""
-        if self.patterns_path.exists():
-            try:
-                data = json.load(open(self.patterns_path))
-                return list(data.get("domains", {}).keys())
-            except json.JSONDecodeError:
-                return []
-        return []
+        return list(self._data.get("domains", {}).keys())
+    
+    def structure_version(self) -> str:
+        """
+        Fingerprint of the library's structure.
+        
+        Covers domains, pattern names, triggers and skills; confidence and
+        usage counts are ignored, so learning does not change the version.
+        """
+        if self._structure_version is None:
+            structure = {
+                domain: [
+                    [pattern.get("name"), pattern.get("triggers", []), pattern.get("skills", [])]
+                    for pattern in content.get("patterns", [])
+                ]
+                for domain, content in self._data.get("domains", {}).items()
+            }
+            payload = json.dumps(structure, sort_keys=True).encode()
+            self._structure_version = hashlib.sha256(payload).hexdigest()[:16]
+        return self._structure_version
 
 
 class SkillRegistry:
@@ -489,6 +875,102 @@ class SkillRegistry:
                 if skill.get("type") == skill_type]
 
 
+class ResearchCache:
+    """
+    On-disk memo of research results (SQLite, WAL mode).
+    
+    Keyed by normalized query, complexity, depth and the pattern library
+    structure version. Entries expire after `ttl` seconds; beyond
+    `max_entries` the least recently used are evicted.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = None,
+        ttl: float = 7 * 86400,
+        max_entries: int = 1000
+    ):
+        if db_path is None:
+            base_path = Path(__file__).parent.parent
+            db_path = base_path / "memory" / "research-cache.db"
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS research_cache ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "created REAL NOT NULL, "
+                "accessed REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS research_cache_accessed ON research_cache (accessed)"
+            )
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection that waits on other writers; commits on success, always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def make_key(query: str, complexity: str, depth: int, library_version: str) -> str:
+        """Cache key for a research task."""
+        normalized = " ".join(query.lower().split())
+        payload = json.dumps([normalized, complexity, depth, library_version])
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> dict | None:
+        """Get a live entry and mark it recently used."""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created FROM research_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                conn.execute("DELETE FROM research_cache WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE research_cache SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+    
+    def put(self, key: str, value: dict) -> bool:
+        """Store an entry, then drop expired and least recently used ones."""
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            return False
+        
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO research_cache (key, value, created, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, now)
+            )
+            conn.execute("DELETE FROM research_cache WHERE created < ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM research_cache WHERE key IN ("
+                "SELECT key FROM research_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        return True
+    
+    def clear(self):
+        """Remove every entry."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM research_cache")
+
+
 class ExecutionFeedback:
     """
     Feedback loop for learning from executions (RLM Pattern 3).
@@ -498,23 +980,59 @@ class ExecutionFeedback:
     - Execution time
     - Confidence changes
     - Patterns used
+    
+    Entries are appended through a batched JSONLWriter; the log rotates
+    into numbered segments by size and statistics read across them.
+    Statistics come from in-memory aggregates plus entries still queued,
+    so reading them never waits on the disk. The writer folds each batch
+    into the aggregates, and the summary sidecar is checkpointed from
+    there at most every summary_interval seconds and on flush().
     """
     
-    def __init__(self, log_path: str = None):
+    def __init__(
+        self,
+        log_path: str = None,
+        fsync: str = "interval",
+        max_bytes: int = 64 * 1024 * 1024,
+        summary_interval: float = 5.0
+    ):
         if log_path is None:
             base_path = Path(__file__).parent.parent
             log_path = base_path / "memory" / "research-execution-log.jsonl"
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = JSONLWriter(
+            self.log_path, fsync=fsync, max_bytes=max_bytes, on_batch=self._on_batch
+        )
+        
+        # Rolling aggregates, checkpointed by byte offset into the log
+        self.summary_path = self.log_path.with_name(self.log_path.stem + ".summary.json")
+        self.summary_interval = summary_interval
+        self._lock = threading.Lock()
+        # Keeps _pending in the writer's queue order
+        self._order_lock = threading.Lock()
+        # Logged entries the writer has not handled yet, oldest first
+        self._pending: deque = deque()
+        self._summary = self._load_summary()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        with self._lock:
+            self._refresh_summary_locked()
     
     def log_execution(
         self,
         task: str,
         patterns: list[str],
         skills: list[str],
-        result: ExecutionResult
+        result: ExecutionResult,
+        cached: bool = False
     ):
-        """Log an execution for learning."""
+        """
+        Log an execution for learning.
+        
+        Cached executions count towards totals and cache_hits but not
+        towards per-pattern or per-skill learning.
+        """
         log_entry = {
             "timestamp": time.time(),
             "iso_time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -527,97 +1045,452 @@ class ExecutionFeedback:
             "error": result.error,
             "output_type": type(result.output).__name__ if result.output else None
         }
+        if cached:
+            log_entry["cached"] = True
         
-        with open(self.log_path, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        with self._order_lock:
+            self._pending.append(log_entry)
+            try:
+                self._writer.write(log_entry)
+            except Exception:
+                self._pending.pop()
+                raise
     
-    def get_statistics(self) -> dict:
-        """Get execution statistics for analysis."""
-        stats = {
+    def flush(self):
+        """Wait until all logged executions are on disk and checkpoint the summary."""
+        self._writer.flush()
+        with self._lock:
+            self._refresh_summary_locked()
+            self._save_summary_locked()
+    
+    def _on_batch(self, count: int):
+        """Writer callback: fold the batch just handled into the aggregates."""
+        with self._lock:
+            for _ in range(min(count, len(self._pending))):
+                self._pending.popleft()
+            self._refresh_summary_locked()
+            if time.monotonic() - self._last_save >= self.summary_interval:
+                self._save_summary_locked()
+    
+    def _save_summary_locked(self):
+        """Write the sidecar if the aggregates moved; caller holds the lock."""
+        if self._dirty:
+            _atomic_write_json(self.summary_path, self._summary, indent=None)
+            self._dirty = False
+        self._last_save = time.monotonic()
+    
+    def _current_summary(self) -> dict:
+        """Copy of the aggregates including entries the writer still holds."""
+        with self._lock:
+            summary = copy.deepcopy(self._summary)
+            pending = list(self._pending)
+        for entry in pending:
+            self._fold_entry(summary, entry)
+        return summary
+    
+    @staticmethod
+    def _empty_summary() -> dict:
+        """Aggregates for an empty log."""
+        return {
+            "segment": 0,
+            "offset": 0,
+            "inode": None,
             "total_executions": 0,
-            "success_rate": 0.0,
-            "avg_execution_time": 0.0,
+            "successes": 0,
             "total_execution_time": 0.0,
-            "patterns_by_usage": {},
-            "skills_by_usage": {},
-            "skills_by_success_rate": {},
+            "cache_hits": 0,
+            "patterns": {},
+            "skills": {},
             "recent_executions": []
         }
+    
+    def _load_summary(self) -> dict:
+        """Load the sidecar summary, or start from scratch."""
+        if self.summary_path.exists():
+            try:
+                with open(self.summary_path) as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                pass
+        return self._empty_summary()
+    
+    def _fold_entry(self, summary: dict, entry: dict):
+        """Add one log entry to the rolling aggregates."""
+        success = entry.get("success", False)
+        execution_time = entry.get("execution_time", 0)
         
-        if not self.log_path.exists():
-            return stats
+        summary["total_executions"] += 1
+        summary["successes"] += 1 if success else 0
+        summary["total_execution_time"] += execution_time
+        
+        if entry.get("cached"):
+            summary["cache_hits"] = summary.get("cache_hits", 0) + 1
+            summary["recent_executions"].append(entry)
+            del summary["recent_executions"][:-10]
+            return
         
-        executions = []
-        with open(self.log_path, "r") as f:
+        patterns = summary["patterns"]
+        patterns_used = entry.get("patterns_used", [])
+        for pattern in patterns_used:
+            if pattern not in patterns:
+                patterns[pattern] = {"count": 0, "executions": 0, "successes": 0, "total_time": 0.0}
+            patterns[pattern]["count"] += 1
+        for pattern in set(patterns_used):
+            patterns[pattern]["executions"] += 1
+            patterns[pattern]["successes"] += 1 if success else 0
+            patterns[pattern]["total_time"] += execution_time
+        
+        skills = summary["skills"]
+        for skill in entry.get("skills_activated", []):
+            if skill not in skills:
+                skills[skill] = {"count": 0, "successes": 0}
+            skills[skill]["count"] += 1
+            skills[skill]["successes"] += 1 if success else 0
+        
+        summary["recent_executions"].append(entry)
+        del summary["recent_executions"][:-10]
+    
+    def _fold_file(self, summary: dict, path: Path, offset: int) -> int:
+        """Fold complete lines of a file from offset; returns the new offset."""
+        with open(path, "rb") as f:
+            f.seek(offset)
             for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written line; pick it up next time
+                    break
+                offset += len(line)
                 try:
-                    entry = json.loads(line)
-                    executions.append(entry)
+                    self._fold_entry(summary, json.loads(line))
                 except json.JSONDecodeError:
                     continue
+        return offset
+    
+    def _refresh_summary_locked(self) -> dict:
+        """Fold in new log lines across rotated segments; caller holds the lock."""
+        summary = self._summary
+        position = (summary.get("segment", 0), summary["offset"])
         
-        if not executions:
-            return stats
+        # Segments rotated since the last refresh; the first one is the file
+        # that was active then, so reading resumes at the saved offset
+        new_segments = [
+            (number, path) for number, path in _rotated_segments(self.log_path)
+            if number > summary.get("segment", 0)
+        ]
+        active = self.log_path.stat() if self.log_path.exists() else None
         
-        stats["total_executions"] = len(executions)
-        stats["recent_executions"] = executions[-10:]  # Last 10
+        if not new_segments and (
+            active is None
+            or active.st_ino != summary["inode"]
+            or active.st_size < summary["offset"]
+        ):
+            # Log was replaced or truncated: rebuild from the first segment
+            summary = self._empty_summary()
+            new_segments = _rotated_segments(self.log_path)
         
-        successful = [e for e in executions if e.get("success", False)]
-        stats["success_rate"] = len(successful) / len(executions) if executions else 0
+        for number, path in new_segments:
+            self._fold_file(summary, path, summary["offset"])
+            summary["segment"] = number
+            summary["offset"] = 0
         
-        times = [e.get("execution_time", 0) for e in executions]
-        stats["avg_execution_time"] = sum(times) / len(times) if times else 0
-        stats["total_execution_time"] = sum(times)
+        if active is not None:
+            summary["inode"] = active.st_ino
+            summary["offset"] = self._fold_file(summary, self.log_path, summary["offset"])
         
-        for entry in executions:
-            for pattern in entry.get("patterns_used", []):
-                if pattern not in stats["patterns_by_usage"]:
-                    stats["patterns_by_usage"][pattern] = 0
-                stats["patterns_by_usage"][pattern] += 1
-            
-            for skill in entry.get("skills_activated", []):
-                if skill not in stats["skills_by_usage"]:
-                    stats["skills_by_usage"][skill] = 0
-                stats["skills_by_usage"][skill] += 1
-                
-                if skill not in stats["skills_by_success_rate"]:
-                    stats["skills_by_success_rate"][skill] = {"success": 0, "total": 0}
-                stats["skills_by_success_rate"][skill]["total"] += 1
-                if entry.get("success", False):
-                    stats["skills_by_success_rate"][skill]["success"] += 1
+        if summary is not self._summary or (summary["segment"], summary["offset"]) != position:
+            self._summary = summary
+            self._dirty = True
+        return summary
+    
+    def get_statistics(self) -> dict:
+        """Get execution statistics for analysis."""
+        summary = self._current_summary()
+        
+        stats = {
+            "total_executions": 0,
+            "success_rate": 0.0,
+            "avg_execution_time": 0.0,
+            "total_execution_time": 0.0,
+            "cache_hits": 0,
+            "patterns_by_usage": {},
+            "skills_by_usage": {},
+            "skills_by_success_rate": {},
+            "recent_executions": []
+        }
+        
+        total = summary["total_executions"]
+        if not total:
+            return stats
         
-        # Calculate success rates
-        for skill, data in stats["skills_by_success_rate"].items():
-            data["success_rate"] = data["success"] / data["total"] if data["total"] > 0 else 0
+        stats["total_executions"] = total
+        stats["recent_executions"] = list(summary["recent_executions"])
+        stats["success_rate"] = summary["successes"] / total
+        stats["avg_execution_time"] = summary["total_execution_time"] / total
+        stats["total_execution_time"] = summary["total_execution_time"]
+        stats["cache_hits"] = summary.get("cache_hits", 0)
+        stats["patterns_by_usage"] = {
+            pattern: data["count"] for pattern, data in summary["patterns"].items()
+        }
+        stats["skills_by_usage"] = {
+            skill: data["count"] for skill, data in summary["skills"].items()
+        }
+        stats["skills_by_success_rate"] = {
+            skill: {
+                "success": data["successes"],
+                "total": data["count"],
+                "success_rate": data["successes"] / data["count"] if data["count"] > 0 else 0
+            }
+            for skill, data in summary["skills"].items()
+        }
         
         return stats
     
     def get_pattern_learnings(self, pattern_name: str) -> dict:
         """Get learning statistics for a specific pattern."""
-        if not self.log_path.exists():
-            return {"usages": 0, "success_rate": 0}
-        
-        pattern_usages = []
-        with open(self.log_path, "r") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    if pattern_name in entry.get("patterns_used", []):
-                        pattern_usages.append(entry)
-                except json.JSONDecodeError:
-                    continue
-        
-        if not pattern_usages:
+        data = self._current_summary()["patterns"].get(pattern_name)
+        if not data or not data["executions"]:
             return {"usages": 0, "success_rate": 0}
         
-        successful = [e for e in pattern_usages if e.get("success", False)]
         return {
-            "usages": len(pattern_usages),
-            "success_rate": len(successful) / len(pattern_usages) if pattern_usages else 0,
-            "avg_execution_time": sum(e.get("execution_time", 0) for e in pattern_usages) / len(pattern_usages)
+            "usages": data["executions"],
+            "success_rate": data["successes"] / data["executions"],
+            "avg_execution_time": data["total_time"] / data["executions"]
         }
 
 
+class ResultStore:
+    """
+    LRU of recent execution results keyed by "<pattern>_<skill>".
+    
+    Outputs whose JSON form exceeds spill_threshold bytes are written to
+    this store's own subdirectory of spill_dir and loaded back on access;
+    in memory the entry keeps a truncated JSON preview. A spill file is
+    deleted when its last entry is evicted, and the least recently used
+    files beyond max_spill_bytes are dropped early. clear() (also run at
+    exit) removes the directory. Directories are named <pid>-<random>; one
+    whose process is no longer running is removed when a store starts
+    (where liveness can't be checked, e.g. on Windows, it is removed once
+    untouched for stale_after seconds). If a spill file is missing or
+    unreadable, the truncated result is returned.
+    """
+    
+    PREVIEW_CHARS = 1024
+    
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        spill_dir: str = None,
+        spill_threshold: int = 64 * 1024,
+        max_spill_bytes: int = 256 * 1024 * 1024,
+        stale_after: float = 24 * 3600
+    ):
+        if spill_dir is None:
+            base_path = Path(__file__).parent.parent
+            spill_dir = base_path / "memory" / "result-spill"
+        self.max_entries = max_entries
+        self.spill_root = Path(spill_dir)
+        self.spill_dir = self.spill_root / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.spill_threshold = spill_threshold
+        self.max_spill_bytes = max_spill_bytes
+        self.stale_after = stale_after
+        self._entries: OrderedDict[str, ExecutionResult] = OrderedDict()
+        # digest -> [entry references, size], least recently used first
+        self._spill_files: OrderedDict[str, list[int]] = OrderedDict()
+        self._spill_bytes = 0
+        self._lock = threading.Lock()
+        self._prune_stale()
+        atexit.register(self.clear)
+    
+    def __setitem__(self, key: str, result: ExecutionResult):
+        payload = self._spill_payload(result)
+        with self._lock:
+            if payload is not None:
+                result = self._spill(result, payload)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._release(previous)
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._release(evicted)
+            self._enforce_spill_cap()
+    
+    def __getitem__(self, key: str) -> ExecutionResult:
+        with self._lock:
+            result = self._entries[key]
+            self._entries.move_to_end(key)
+            digest = result.metadata.get("spilled_output")
+            if digest in self._spill_files:
+                self._spill_files.move_to_end(digest)
+        return self._unspill(result)
+    
+    def get(self, key: str, default: ExecutionResult = None) -> ExecutionResult | None:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def keys(self) -> list[str]:
+        """Keys from least to most recently used."""
+        with self._lock:
+            return list(self._entries)
+    
+    def clear(self):
+        """Drop every entry and delete this store's spill directory."""
+        with self._lock:
+            self._entries.clear()
+            self._spill_files.clear()
+            self._spill_bytes = 0
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+    
+    def _spill_payload(self, result: ExecutionResult) -> bytes | None:
+        """JSON form of a large output, or None if it stays in memory."""
+        if result.output is None:
+            return None
+        try:
+            payload = json.dumps(result.output, sort_keys=True).encode()
+        except (TypeError, ValueError):
+            return None
+        return payload if len(payload) > self.spill_threshold else None
+    
+    def _spill(self, result: ExecutionResult, payload: bytes) -> ExecutionResult:
+        """Move a large output to the spill directory (caller holds the lock)."""
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.spill_dir / f"{digest}.json"
+        if digest not in self._spill_files:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.spill_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self._spill_files[digest] = [0, len(payload)]
+            self._spill_bytes += len(payload)
+        self._spill_files[digest][0] += 1
+        self._spill_files.move_to_end(digest)
+        
+        preview = payload[:self.PREVIEW_CHARS].decode("utf-8", "ignore")
+        return replace(
+            result,
+            output=preview,
+            metadata={**result.metadata, "spilled_output": digest, "truncated": True}
+        )
+    
+    def _release(self, result: ExecutionResult):
+        """Drop an entry's reference to its spill file (caller holds the lock)."""
+        digest = result.metadata.get("spilled_output")
+        spill = self._spill_files.get(digest)
+        if spill is None:
+            return
+        spill[0] -= 1
+        if spill[0] <= 0:
+            self._delete_spill(digest)
+    
+    def _enforce_spill_cap(self):
+        """Delete least recently used spill files beyond max_spill_bytes (caller holds the lock)."""
+        while self._spill_bytes > self.max_spill_bytes and self._spill_files:
+            self._delete_spill(next(iter(self._spill_files)))
+    
+    def _delete_spill(self, digest: str):
+        """Remove one spill file (caller holds the lock)."""
+        _, size = self._spill_files.pop(digest)
+        self._spill_bytes -= size
+        try:
+            (self.spill_dir / f"{digest}.json").unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _prune_stale(self):
+        """Remove spill directories whose owning process has exited."""
+        if not self.spill_root.is_dir():
+            return
+        cutoff = time.time() - self.stale_after
+        for child in self.spill_root.iterdir():
+            try:
+                if not child.is_dir():
+                    continue
+                alive = self._owner_alive(child.name)
+                if alive is False or (alive is None and child.stat().st_mtime < cutoff):
+                    shutil.rmtree(child, ignore_errors=True)
+            except OSError:
+                continue
+    
+    @staticmethod
+    def _owner_alive(name: str) -> bool | None:
+        """Whether the pid in a spill directory name is running; None if unknown."""
+        pid, _, _ = name.partition("-")
+        # Signal 0 only probes on POSIX (on Windows it would send CTRL_C_EVENT)
+        if not pid.isdigit() or os.name != "posix":
+            return None
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True  # exists, owned by another user
+        return True
+    
+    def _unspill(self, result: ExecutionResult) -> ExecutionResult:
+        """Load a spilled output back, or keep the truncated preview if it is gone."""
+        digest = result.metadata.get("spilled_output")
+        if digest is None:
+            return result
+        metadata = {k: v for k, v in result.metadata.items() if k != "spilled_output"}
+        try:
+            with open(self.spill_dir / f"{digest}.json") as f:
+                output = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return replace(result, metadata=metadata)
+        metadata.pop("truncated", None)
+        return replace(result, output=output, metadata=metadata)
+
+
+class CompletionEvaluator:
+    """
+    Incremental completion check for one iteration.
+    
+    Results are added as they arrive, weighted by how many patterns use
+    the skill. The iteration is complete when the success rate of the
+    results seen so far reaches the threshold; it can stop early once the
+    successes alone reach the threshold of everything expected.
+    """
+    
+    def __init__(self, expected: int, threshold: float = 0.7):
+        self.expected = expected
+        self.threshold = threshold
+        self.total = 0
+        self.successful = 0
+    
+    def add(self, result: ExecutionResult, weight: int = 1):
+        """Record a result counted `weight` times."""
+        self.total += weight
+        if result.success and result.output:
+            self.successful += weight
+    
+    @property
+    def success_rate(self) -> float:
+        return self.successful / self.total if self.total else 0.0
+    
+    def should_stop(self) -> bool:
+        """True when the threshold is met whatever the remaining results are."""
+        return self.expected > 0 and self.successful >= self.threshold * self.expected
+    
+    def completion(self) -> str | None:
+        """Completion message, or None if the threshold is not met."""
+        if not self.total or self.success_rate < self.threshold:
+            return None
+        return (
+            f"Completed {self.successful}/{self.total} steps successfully "
+            f"({(self.success_rate*100):.0f}% success rate)"
+        )
+
+
 class RecursiveOrchestrator:
     """
     Recursive orchestrator for complex research tasks (RLM Pattern 4).
@@ -626,25 +1499,52 @@ class RecursiveOrchestrator:
     - Iterative refinement with max iterations
     - Depth-based complexity routing
     - Termination detection
+    - Optional concurrent skill activation (max_parallel_skills > 1) with
+      per-skill timeouts
+    - Early completion once enough results succeed (CompletionEvaluator)
+    - on_result callback for streaming results as skills finish
+    - Bounded state: recent results in a ResultStore (LRU with a capped,
+      self-cleaning spill to disk) and compact history records in a deque
+      of max_history
     """
     
+    COMPLETION_THRESHOLD = 0.7
+    
     def __init__(
         self,
         pattern_library: PatternLibrary,
         skill_registry: SkillRegistry,
         feedback: ExecutionFeedback,
-        max_iterations: int = 10
+        max_iterations: int = 10,
+        max_parallel_skills: int = 1,
+        skill_timeout: float = None,
+        max_state_entries: int = 1000,
+        max_history: int = 1000,
+        spill_dir: str = None
     ):
         self.pattern_library = pattern_library
         self.skill_registry = skill_registry
         self.feedback = feedback
         self.max_iterations = max_iterations
-        self.state = {}
-        self.execution_history = []
+        self.max_parallel_skills = max_parallel_skills
+        self.skill_timeout = skill_timeout
+        self.state = ResultStore(max_entries=max_state_entries, spill_dir=spill_dir)
+        self.execution_history = deque(maxlen=max_history)
+        # Guards history when tasks execute concurrently (state locks itself)
+        self._state_lock = threading.Lock()
+        self._executor = None
+        self._executor_lock = threading.Lock()
     
-    def execute(self, task: ResearchTask) -> ExecutionResult:
+    def execute(
+        self,
+        task: ResearchTask,
+        on_result: Callable[[int, str, ExecutionResult], None] = None
+    ) -> ExecutionResult:
         """
         Execute a research task with recursive orchestration.
+        
+        on_result, if given, is called as (iteration, skill_name, result)
+        for each skill activation as soon as it completes.
         """
         start_time = time.perf_counter()
         patterns_used = []
@@ -655,39 +1555,48 @@ class RecursiveOrchestrator:
         matched_patterns = self.pattern_library.find_matching_patterns(task.description)
         
         for i in range(self.max_iterations):
-            current_results = []
+            # Activate each skill once, even when several patterns share it
+            fanout = self._plan_iteration(matched_patterns)
+            evaluator = CompletionEvaluator(sum(fanout.values()), self.COMPLETION_THRESHOLD)
             
-            # Activate skills for each pattern
+            def record(skill_name: str, result: ExecutionResult, iteration: int = i + 1):
+                evaluator.add(result, fanout[skill_name])
+                if on_result is not None:
+                    on_result(iteration, skill_name, result)
+            
+            if self.max_parallel_skills > 1 and len(fanout) > 1:
+                activations = self._activate_parallel(list(fanout), evaluator, record)
+            else:
+                activations = self._activate_sequential(list(fanout), evaluator, record)
+            skills_activated.extend(activations)
+            
+            # Fan results out to every pattern that uses them; skills
+            # cancelled by early completion have no result
+            current_results = []
+            confidence_updates = []
             for pattern in matched_patterns:
                 pattern_name = pattern["name"]
                 patterns_used.append(pattern_name)
                 
-                skills = pattern.get("skills", [])
-                for skill_name in skills:
-                    skills_activated.append(skill_name)
-                    
-                    result = self.skill_registry.activate_skill(skill_name)
+                for skill_name in pattern.get("skills", []):
+                    result = activations.get(skill_name)
+                    if result is None:
+                        continue
                     current_results.append(result)
-                    
-                    # Update pattern confidence
-                    self.pattern_library.update_confidence(
-                        pattern_name,
-                        result.success
-                    )
+                    confidence_updates.append((pattern_name, result.success))
                     
                     # Store in state
                     self.state[f"{pattern_name}_{skill_name}"] = result
             
+            # Update pattern confidence for the whole iteration at once
+            self.pattern_library.update_confidence_batch(confidence_updates)
             results.extend(current_results)
             
             # Check for completion
-            completion = self._check_completion(current_results, task)
+            completion = evaluator.completion()
             if completion:
-                self.execution_history.append({
-                    "iteration": i + 1,
-                    "patterns": patterns_used.copy(),
-                    "skills": skills_activated.copy()
-                })
+                self.pattern_library.flush()
+                self._record_history(i + 1, patterns_used, skills_activated)
                 
                 self.feedback.log_execution(
                     task.description,
@@ -714,12 +1623,9 @@ class RecursiveOrchestrator:
                 break
         
         # Max iterations reached
+        self.pattern_library.flush()
         final_output = self._finalize_results(results)
-        self.execution_history.append({
-            "iteration": self.max_iterations,
-            "patterns": patterns_used.copy(),
-            "skills": skills_activated.copy()
-        })
+        self._record_history(self.max_iterations, patterns_used, skills_activated)
         
         self.feedback.log_execution(
             task.description,
@@ -739,19 +1645,139 @@ class RecursiveOrchestrator:
             metadata={"iterations": self.max_iterations, "patterns_used": patterns_used}
         )
     
-    def _check_completion(self, results: list[ExecutionResult], task: ResearchTask) -> str | None:
-        """Check if task is complete."""
-        if not results:
-            return None
+    def _record_history(self, iterations: int, patterns_used: list[str], skills_activated: list[str]):
+        """Append a compact history record: counts plus unique ids."""
+        with self._state_lock:
+            self.execution_history.append({
+                "iteration": iterations,
+                "pattern_count": len(patterns_used),
+                "skill_count": len(skills_activated),
+                "patterns": list(dict.fromkeys(patterns_used)),
+                "skills": list(dict.fromkeys(skills_activated))
+            })
+    
+    @staticmethod
+    def _plan_iteration(patterns: list[dict]) -> dict[str, int]:
+        """Unique skills needed by the patterns (first-use order) -> fan-out."""
+        fanout = {}
+        for pattern in patterns:
+            for skill_name in pattern.get("skills", []):
+                fanout[skill_name] = fanout.get(skill_name, 0) + 1
+        return fanout
+    
+    def _activate_sequential(
+        self,
+        plan: list[str],
+        evaluator: CompletionEvaluator,
+        record: Callable[[str, ExecutionResult], None]
+    ) -> dict[str, ExecutionResult]:
+        """Activate skills one at a time, stopping once completion is certain."""
+        activations = {}
+        for skill_name in plan:
+            result = self.skill_registry.activate_skill(skill_name)
+            activations[skill_name] = result
+            record(skill_name, result)
+            if evaluator.should_stop():
+                break
+        return activations
+    
+    def close(self):
+        """Shut down the skill pool (waiting for running skills) and drop spilled state."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.state.clear()
+    
+    def __enter__(self) -> "RecursiveOrchestrator":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Shared bounded pool for concurrent skill activation."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_parallel_skills,
+                    thread_name_prefix="skill"
+                )
+            return self._executor
+    
+    def _activate_parallel(
+        self,
+        plan: list[str],
+        evaluator: CompletionEvaluator,
+        record: Callable[[str, ExecutionResult], None]
+    ) -> dict[str, ExecutionResult]:
+        """
+        Activate skills concurrently, in completion order.
         
-        successful = [r for r in results if r.success and r.output]
-        success_rate = len(successful) / len(results) if results else 0
+        Every skill gets skill_timeout seconds from submission; one still
+        unfinished then yields a failed result. Queued skills are
+        cancelled, and if a running worker had to be abandoned the pool is
+        replaced so later skills don't queue behind it. Pending skills are
+        cancelled once the evaluator can stop early.
+        """
+        executor = self._get_executor()
+        submitted = time.monotonic()
+        pending = {
+            executor.submit(self.skill_registry.activate_skill, skill_name): skill_name
+            for skill_name in plan
+        }
+        deadline = submitted + self.skill_timeout if self.skill_timeout is not None else None
+        activations = {}
+        abandoned = False
         
-        # Completion criteria: 70% success rate
-        if success_rate >= 0.7:
-            return f"Completed {len(successful)}/{len(results)} steps successfully ({(success_rate*100):.0f}% success rate)"
+        while pending:
+            wait_for = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, _ = concurrent.futures.wait(
+                pending, timeout=wait_for,
+                return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            
+            for future in done:
+                skill_name = pending.pop(future)
+                activations[skill_name] = future.result()
+                record(skill_name, activations[skill_name])
+            
+            if deadline is not None and pending and time.monotonic() >= deadline:
+                now = time.monotonic()
+                for future, skill_name in list(pending.items()):
+                    # A running worker thread cannot be interrupted; drop its result
+                    if not future.cancel():
+                        abandoned = True
+                    del pending[future]
+                    activations[skill_name] = ExecutionResult(
+                        success=False,
+                        error=f"Skill '{skill_name}' timed out after {self.skill_timeout}s",
+                        execution_time=now - submitted
+                    )
+                    record(skill_name, activations[skill_name])
+            
+            if pending and evaluator.should_stop():
+                for future in pending:
+                    future.cancel()
+                break
         
-        return None
+        if abandoned:
+            self._retire_executor(executor)
+        return activations
+    
+    def _retire_executor(self, executor: concurrent.futures.ThreadPoolExecutor):
+        """Stop handing work to a pool held by abandoned workers; they exit when done."""
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+    
+    def _check_completion(self, results: list[ExecutionResult], task: ResearchTask) -> str | None:
+        """Check if task is complete."""
+        evaluator = CompletionEvaluator(len(results), self.COMPLETION_THRESHOLD)
+        for result in results:
+            evaluator.add(result)
+        return evaluator.completion()
     
     def _refine_patterns(
         self,
@@ -794,10 +1820,13 @@ class RecursiveOrchestrator:
     
     def get_state(self) -> dict:
         """Get current orchestrator state."""
+        state_keys = self.state.keys()
+        with self._state_lock:
+            history = list(self.execution_history)
         return {
-            "state_keys": list(self.state.keys()),
-            "execution_history": self.execution_history,
-            "patterns_in_state": len([k for k in self.state.keys() if not k.startswith("_")])
+            "state_keys": state_keys,
+            "execution_history": history,
+            "patterns_in_state": len([k for k in state_keys if not k.startswith("_")])
         }
 
 
@@ -808,21 +1837,44 @@ class AIReseachOrchestrator:
     Entry point for AI research workflows.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_parallel_skills: int = 1,
+        skill_timeout: float = None
+    ):
+        self.max_workers = max_workers
         self.pattern_library = PatternLibrary()
         self.skill_registry = SkillRegistry()
         self.feedback = ExecutionFeedback()
+        self.research_cache = ResearchCache()
         self.orchestrator = RecursiveOrchestrator(
             self.pattern_library,
             self.skill_registry,
-            self.feedback
+            self.feedback,
+            max_parallel_skills=max_parallel_skills,
+            skill_timeout=skill_timeout
         )
     
+    def close(self):
+        """Stop the skill pool and write out buffered confidence and log records."""
+        self.orchestrator.close()
+        self.pattern_library.flush()
+        self.feedback.flush()
+    
+    def __enter__(self) -> "AIReseachOrchestrator":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def research(
         self,
         query: str,
         complexity: str = "medium",
-        depth: int = 3
+        depth: int = 3,
+        on_result: Callable[[int, str, ExecutionResult], None] = None,
+        use_cache: bool = True
     ) -> dict:
         """
         Execute an AI research task.
@@ -831,17 +1883,37 @@ class AIReseachOrchestrator:
             query: Research question or task description
             complexity: Task complexity (low, medium, high)
             depth: Maximum recursion depth
+            on_result: Called as (iteration, skill_name, result) per activation
+            use_cache: Serve and store results in the research cache
         
         Returns:
             Research results
         """
+        cache_key = None
+        if use_cache:
+            start_time = time.perf_counter()
+            cache_key = ResearchCache.make_key(
+                query, complexity, depth, self.pattern_library.structure_version()
+            )
+            cached = self.research_cache.get(cache_key)
+            if cached is not None:
+                return self._cached_research(query, cached, time.perf_counter() - start_time)
+        
         task = ResearchTask(
             description=query,
             complexity=complexity,
             max_depth=depth
         )
         
-        result = self.orchestrator.execute(task)
+        result = self.orchestrator.execute(task, on_result=on_result)
+        
+        if cache_key is not None and result.success:
+            self.research_cache.put(cache_key, {
+                "success": result.success,
+                "output": result.output,
+                "execution_time": result.execution_time,
+                "metadata": result.metadata
+            })
         
         return {
             "query": query,
@@ -852,33 +1924,110 @@ class AIReseachOrchestrator:
             "statistics": self.feedback.get_statistics()
         }
     
+    def _cached_research(self, query: str, cached: dict, execution_time: float) -> dict:
+        """Build a research result from a cache entry and log the hit."""
+        metadata = {**cached["metadata"], "cached": True}
+        self.feedback.log_execution(
+            query,
+            metadata.get("patterns_used", []),
+            [],
+            ExecutionResult(
+                success=cached["success"],
+                output=cached["output"],
+                execution_time=execution_time
+            ),
+            cached=True
+        )
+        return {
+            "query": query,
+            "success": cached["success"],
+            "output": cached["output"],
+            "execution_time": execution_time,
+            "metadata": metadata,
+            "statistics": self.feedback.get_statistics()
+        }
+    
+    def research_stream(
+        self,
+        query: str,
+        complexity: str = "medium",
+        depth: int = 3,
+        use_cache: bool = True
+    ) -> Iterator[dict]:
+        """
+        Execute a research task, yielding partial results as skills finish.
+        
+        Yields {"type": "partial", "iteration", "skill", "success", "output",
+        "error"} for each activation, then {"type": "final", **research()}.
+        """
+        events = queue.Queue()
+        
+        def on_result(iteration: int, skill_name: str, result: ExecutionResult):
+            events.put({
+                "type": "partial",
+                "iteration": iteration,
+                "skill": skill_name,
+                "success": result.success,
+                "output": result.output,
+                "error": result.error
+            })
+        
+        def run():
+            try:
+                events.put({"type": "final", **self.research(query, complexity, depth, on_result, use_cache)})
+            except BaseException as e:
+                events.put(e)
+        
+        worker = threading.Thread(target=run, name="research-stream", daemon=True)
+        worker.start()
+        
+        while True:
+            event = events.get()
+            if isinstance(event, BaseException):
+                raise event
+            yield event
+            if event["type"] == "final":
+                break
+        worker.join()
+    
     def parallel_research(
         self,
         queries: list[str],
-        complexity: str = "medium"
+        complexity: str = "medium",
+        max_workers: int = None,
+        use_cache: bool = True
     ) -> list[dict]:
         """
         Execute multiple research queries in parallel.
+        
+        Queries run on a thread pool of `max_workers` (default: the
+        orchestrator's max_workers). Results are in the same order as queries.
         """
-        results = []
-        for query in queries:
-            results.append(self.research(query, complexity))
-        return results
+        if not queries:
+            return []
+        
+        workers = min(max_workers or self.max_workers, len(queries))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda query: self.research(query, complexity, use_cache=use_cache), queries
+            ))
     
-    def analyze_paper(self, paper_path: str) -> dict:
+    def analyze_paper(self, paper_path: str, use_cache: bool = True) -> dict:
         """Analyze a research paper."""
         return self.research(
             f"Analyze paper at {paper_path}",
             complexity="high",
-            depth=2
+            depth=2,
+            use_cache=use_cache
         )
     
-    def survey_topic(self, topic: str) -> dict:
+    def survey_topic(self, topic: str, use_cache: bool = True) -> dict:
         """Survey a research topic."""
         return self.research(
             f"Survey current research on {topic}",
             complexity="medium",
-            depth=3
+            depth=3,
+            use_cache=use_cache
         )
     
     def compare_approaches(self, approaches: list[str], task: str) -> dict:
@@ -894,12 +2043,13 @@ class AIReseachOrchestrator:
             "statistics": self.feedback.get_statistics()
         }
     
-    def analyze_attack(self, attack_name: str) -> dict:
+    def analyze_attack(self, attack_name: str, use_cache: bool = True) -> dict:
         """Analyze a specific AI attack technique."""
         return self.research(
             f"Analyze {attack_name} attack technique in AI systems",
             complexity="high",
-            depth=3
+            depth=3,
+            use_cache=use_cache
         )
     
     def get_statistics(self) -> dict:
@@ -0,0 +1,338 @@
+# test_orchestrator.py
+import os
+import sys
+import json
+import random
+import stat
+import time
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from orchestrator import (
+    CompletionEvaluator,
+    ExecutionFeedback,
+    ExecutionResult,
+    JSONLWriter,
+    PatternLibrary,
+    RecursiveOrchestrator,
+    ResearchTask,
+    ResultStore,
+    SkillRegistry,
+    _atomic_write_json,
+)
+
+
+def _flush_in_thread(writer: JSONLWriter, timeout: float = 5.0):
+    """Run writer.flush() on a helper thread; return (finished, raised)."""
+    outcome = {}
+
+    def target():
+        try:
+            writer.flush()
+        except OSError as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive(), outcome.get("error")
+
+
+def test_jsonl_writer_flush_returns_after_failed_write(tmp_path):
+    """A failing batch must not kill the writer thread or hang flush()."""
+    log_path = tmp_path / "log.jsonl"
+    log_path.mkdir()  # appending to a directory raises IsADirectoryError
+    writer = JSONLWriter(log_path, flush_interval=0.05)
+
+    writer.write({"n": 1})
+    finished, error = _flush_in_thread(writer)
+
+    assert finished
+    assert isinstance(error, IsADirectoryError)
+    writer.close()
+
+
+def test_jsonl_writer_recovers_after_failed_write(tmp_path):
+    """Once the path is writable again, later records are appended."""
+    log_path = tmp_path / "log.jsonl"
+    log_path.mkdir()
+    writer = JSONLWriter(log_path, flush_interval=0.05)
+
+    writer.write({"n": 1})
+    with pytest.raises(IsADirectoryError):
+        writer.flush()
+
+    log_path.rmdir()
+    writer.write({"n": 2})
+    writer.flush()
+    writer.close()
+
+    assert log_path.read_text() == '{"n": 2}\n'
+
+
+def test_feedback_statistics_do_not_wait_for_the_writer(tmp_path):
+    """Statistics include queued entries without flushing or rewriting the sidecar."""
+    feedback = ExecutionFeedback(str(tmp_path / "log.jsonl"), summary_interval=3600)
+
+    def no_flush():
+        raise AssertionError("get_statistics() flushed the writer")
+
+    feedback._writer.flush = no_flush
+    for n in range(20):
+        feedback.log_execution("task", ["p"], ["s"], ExecutionResult(success=True, execution_time=1.0))
+    stats = feedback.get_statistics()
+
+    assert stats["total_executions"] == 20
+    assert stats["skills_by_usage"] == {"s": 20}
+    assert feedback.get_pattern_learnings("p")["usages"] == 20
+    assert not feedback.summary_path.exists()
+    del feedback._writer.flush
+    feedback.flush()
+
+
+def test_feedback_flush_checkpoints_summary(tmp_path):
+    """After flush() a fresh instance resumes from the sidecar with the same totals."""
+    log_path = str(tmp_path / "log.jsonl")
+    feedback = ExecutionFeedback(log_path, summary_interval=3600)
+    for n in range(5):
+        feedback.log_execution("task", ["p"], ["s"], ExecutionResult(success=n % 2 == 0, execution_time=1.0))
+    feedback.flush()
+
+    assert feedback.summary_path.exists()
+    stats = ExecutionFeedback(log_path).get_statistics()
+    assert stats["total_executions"] == 5
+    assert stats["success_rate"] == pytest.approx(3 / 5)
+
+
+def _scan_score(query: str, pattern: dict) -> float:
+    """Reference scoring: every trigger of one pattern, checked directly."""
+    score = 0.0
+    for trigger in pattern["triggers"]:
+        if trigger in query:
+            score += 0.4
+        elif query in trigger:
+            score += 0.3
+        else:
+            score += 0.1 * len(set(query.split()) & set(trigger.split()))
+    return min(score * (0.5 + 0.5 * pattern["confidence"]), 1.0)
+
+
+def test_pattern_index_ranks_like_a_full_scan(tmp_path):
+    """Index-based matching returns the same patterns, in the same order, as scoring all."""
+    rng = random.Random(7)
+    words = ["paper", "safety", "red", "team", "code", "review", "memory", "prompt", "survey", "attack"]
+    patterns = [
+        {
+            "name": f"pattern-{n}",
+            "triggers": [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(rng.randint(1, 4))],
+            "confidence": round(rng.uniform(0.1, 1.0), 2),
+            "skills": ["ai-researcher"],
+        }
+        for n in range(200)
+    ]
+    path = tmp_path / "pattern-library.json"
+    path.write_text(json.dumps({"domains": {"research": {"patterns": patterns}}, "metadata": {}}))
+    library = PatternLibrary(str(path))
+
+    queries = ["red team", "paper", "code review of memory", "prompt attack survey", "team", "unrelated"]
+    queries += [" ".join(rng.sample(words, 2)) for _ in range(20)]
+    for query in queries:
+        scored = [(_scan_score(query, p), i) for i, p in enumerate(patterns)]
+        ranked = sorted((item for item in scored if item[0] > 0.2), key=lambda x: (-x[0], x[1]))
+        expected = [patterns[i]["name"] for _, i in ranked[:5]]
+        found = [p["name"] for p in library.find_matching_patterns(query, max_results=5)]
+        assert found == expected, query
+
+
+def test_atomic_write_json_keeps_existing_mode(tmp_path):
+    """Rewriting a file keeps its permissions instead of mkstemp's 0600."""
+    path = tmp_path / "pattern-library.json"
+    path.write_text("{}")
+    os.chmod(path, 0o644)
+
+    _atomic_write_json(path, {"a": 1})
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_atomic_write_json_new_file_follows_umask(tmp_path):
+    """A new file gets 0666 minus the umask, like open() would create it."""
+    path = tmp_path / "summary.json"
+    umask = os.umask(0)
+    os.umask(umask)
+
+    _atomic_write_json(path, {"a": 1})
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+
+def _big_result(n: int = 0) -> ExecutionResult:
+    """A result whose output is large enough to spill."""
+    return ExecutionResult(success=True, output={"n": n, "text": "x" * 2048})
+
+
+def test_result_store_missing_spill_returns_truncated_result(tmp_path):
+    """A deleted spill file degrades to the in-memory preview instead of raising."""
+    store = ResultStore(spill_dir=str(tmp_path), spill_threshold=1024)
+    store["a"] = _big_result()
+
+    assert store["a"].output == _big_result().output
+    for spill_file in store.spill_dir.glob("*.json"):
+        spill_file.unlink()
+
+    result = store.get("a")
+    assert result.metadata["truncated"] is True
+    assert isinstance(result.output, str) and len(result.output) <= ResultStore.PREVIEW_CHARS
+
+
+def test_result_store_corrupt_spill_returns_truncated_result(tmp_path):
+    """An unreadable spill file also degrades to the preview."""
+    store = ResultStore(spill_dir=str(tmp_path), spill_threshold=1024)
+    store["a"] = _big_result()
+    for spill_file in store.spill_dir.glob("*.json"):
+        spill_file.write_text("{not json")
+
+    assert store["a"].metadata["truncated"] is True
+
+
+def test_result_store_deletes_spill_files(tmp_path):
+    """Evicted entries drop their spill files, and clear() removes the directory."""
+    store = ResultStore(max_entries=2, spill_dir=str(tmp_path), spill_threshold=1024)
+    for n in range(5):
+        store[f"k{n}"] = _big_result(n)
+
+    assert len(list(store.spill_dir.glob("*.json"))) == 2
+
+    store.clear()
+    assert not store.spill_dir.exists()
+
+
+def test_result_store_caps_spill_bytes(tmp_path):
+    """Spill files beyond max_spill_bytes are deleted, least recently used first."""
+    store = ResultStore(spill_dir=str(tmp_path), spill_threshold=1024, max_spill_bytes=5000)
+    for n in range(5):
+        store[f"k{n}"] = _big_result(n)
+
+    assert sum(f.stat().st_size for f in store.spill_dir.glob("*.json")) <= 5000
+    assert store["k4"].output == _big_result(4).output
+    assert store["k0"].metadata["truncated"] is True
+
+
+def _exited_pid() -> int:
+    """Pid of a process that has already exited."""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_result_store_prunes_dirs_of_exited_processes(tmp_path):
+    """A directory whose owning process has exited is removed, however recent."""
+    stale = tmp_path / f"{_exited_pid()}-deadbeef"
+    stale.mkdir()
+    (stale / "old.json").write_text("{}")
+
+    ResultStore(spill_dir=str(tmp_path))
+
+    assert not stale.exists()
+
+
+def test_result_store_keeps_dirs_of_live_processes(tmp_path):
+    """A live owner's directory survives even if it has not changed in days."""
+    owner = ResultStore(spill_dir=str(tmp_path), spill_threshold=1024)
+    owner["a"] = _big_result()
+    os.utime(owner.spill_dir, (0, 0))
+
+    ResultStore(spill_dir=str(tmp_path), stale_after=1)
+
+    assert owner.spill_dir.exists()
+    assert owner["a"].output == _big_result().output
+
+
+def test_recursive_orchestrator_close_shuts_down_executor(tmp_path):
+    """close() (via the context manager) shuts the shared skill pool down."""
+    orchestrator = RecursiveOrchestrator(
+        PatternLibrary(str(tmp_path / "pattern-library.json")),
+        SkillRegistry(str(tmp_path / "skill-registry.json")),
+        ExecutionFeedback(str(tmp_path / "log.jsonl")),
+        max_parallel_skills=2,
+        spill_dir=str(tmp_path / "spill")
+    )
+    with orchestrator:
+        executor = orchestrator._get_executor()
+        assert executor.submit(lambda: 1).result() == 1
+
+    assert orchestrator._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: 1)
+
+
+def test_skill_timeouts_do_not_queue_behind_abandoned_workers(tmp_path):
+    """Hung skills time out from submission and do not starve later iterations."""
+    release = threading.Event()
+    orchestrator = RecursiveOrchestrator(
+        PatternLibrary(str(tmp_path / "pattern-library.json")),
+        SkillRegistry(str(tmp_path / "skill-registry.json")),
+        ExecutionFeedback(str(tmp_path / "log.jsonl")),
+        max_iterations=3,
+        max_parallel_skills=2,
+        skill_timeout=0.5,
+        spill_dir=str(tmp_path / "spill")
+    )
+
+    def hang(name, **kwargs):
+        release.wait(6)
+        return ExecutionResult(success=True, output=name)
+
+    orchestrator.skill_registry.activate_skill = hang
+    try:
+        start = time.monotonic()
+        result = orchestrator.execute(ResearchTask("paper analysis"))
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+        orchestrator.close()
+
+    # Three iterations of one 0.5s timeout each, not 6s hangs queued up
+    assert elapsed < 3.0
+    assert result.output["successful_steps"] == 0
+    assert all("timed out" in error for error in result.output["errors"])
+
+
+def test_queued_skill_times_out_from_submission(tmp_path):
+    """A skill still queued when its deadline passes is cancelled and reported."""
+    release = threading.Event()
+    orchestrator = RecursiveOrchestrator(
+        PatternLibrary(str(tmp_path / "pattern-library.json")),
+        SkillRegistry(str(tmp_path / "skill-registry.json")),
+        ExecutionFeedback(str(tmp_path / "log.jsonl")),
+        max_parallel_skills=2,
+        skill_timeout=0.3,
+        spill_dir=str(tmp_path / "spill")
+    )
+    calls = []
+
+    def hang(name, **kwargs):
+        calls.append(name)
+        release.wait(6)
+        return ExecutionResult(success=True, output=name)
+
+    orchestrator.skill_registry.activate_skill = hang
+    try:
+        start = time.monotonic()
+        activations = orchestrator._activate_parallel(
+            ["a", "b", "c"], CompletionEvaluator(3), lambda name, result: None
+        )
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+        orchestrator.close()
+
+    assert elapsed < 1.0
+    assert sorted(activations) == ["a", "b", "c"]
+    assert all("timed out" in r.error for r in activations.values())
+    assert "c" not in calls
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Fake CLI Provider
+
+Local stand-in for kimi/codex/claude used by the orchestration benchmark.
+Sleeps for a configurable delay, then prints a configurable amount of output.
+
+Usage:
+    python eval/fake_provider.py -p "<prompt>"
+    FAKE_PROVIDER_DELAY=0.5 FAKE_PROVIDER_OUTPUT_BYTES=4096 python eval/fake_provider.py "<prompt>"
+
+Environment:
+    FAKE_PROVIDER_DELAY         Seconds to sleep before answering (default 0.05)
+    FAKE_PROVIDER_OUTPUT_BYTES  Bytes of output to print (default 1024)
+    FAKE_PROVIDER_EXIT_CODE     Exit code to return (default 0)
+"""
+
+import os
+import sys
+import time
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "-p"]
+    prompt = args[-1] if args else ""
+
+    delay = float(os.environ.get("FAKE_PROVIDER_DELAY", "0.05"))
+    output_bytes = int(os.environ.get("FAKE_PROVIDER_OUTPUT_BYTES", "1024"))
+    exit_code = int(os.environ.get("FAKE_PROVIDER_EXIT_CODE", "0"))
+
+    time.sleep(delay)
+
+    header = f"fake response ({len(prompt)} chars in)\n"
+    body = "x" * max(0, output_bytes - len(header))
+    sys.stdout.write(header + body)
+    sys.stdout.flush()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
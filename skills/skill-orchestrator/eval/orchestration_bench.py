@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Orchestration Overhead Benchmark
+
+Measures the cost of the orchestration layer separately from model latency
+by pointing every provider at eval/fake_provider.py, a local script with a
+fixed delay and output size. Runs fully offline.
+
+Reports:
+- Orchestration overhead per call (vs. spawning the fake provider directly)
+- Scheduling fairness of parallel swarm execution (Jain's index)
+- Peak Python memory per concurrent task
+
+Usage:
+    python eval/orchestration_bench.py
+    python eval/orchestration_bench.py --delay=0.2 --output-bytes=65536 --concurrency=16
+    python eval/orchestration_bench.py --json > bench.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from orchestrator import (
+    AgentSwarmExecutor,
+    CLIConfig,
+    CLIProvider,
+    ConfidenceStore,
+    MasterSkillOrchestrator,
+    PipelineCache,
+    SkillDiscovery,
+)
+
+
+FAKE_PROVIDER = Path(__file__).parent / "fake_provider.py"
+
+# Run through the current interpreter so the benchmark never depends on
+# (or changes) the script's executable bit
+FAKE_COMMAND = [sys.executable, str(FAKE_PROVIDER)]
+
+BENCH_SKILLS = {
+    "bench-research": "Research and paper analysis for bench tasks",
+    "bench-analysis": "Research analysis of bench results",
+    "bench-docs": "Document bench research findings",
+}
+
+BENCH_TEMPLATES = ["ai-researcher", "code-specialist", "documenter", "analyst"]
+
+BENCH_TASK = "bench research analysis task"
+
+
+def summarize(samples: list[float], baseline: float, ideal: float = None) -> dict:
+    """Summarize wall-time samples against the fake provider baseline."""
+    ideal = baseline if ideal is None else ideal
+    median = statistics.median(samples)
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) >= 2 else median
+    return {
+        "samples": len(samples),
+        "median": median,
+        "p95": p95,
+        "ideal": ideal,
+        "overhead": median - ideal,
+    }
+
+
+def jain_index(values: list[float]) -> float:
+    """Jain's fairness index: 1.0 when all values are equal, 1/n at worst."""
+    if not values or not any(values):
+        return 1.0
+    return sum(values) ** 2 / (len(values) * sum(v * v for v in values))
+
+
+def build_workspace(root: Path):
+    """Create synthetic skills and swarm templates for the benchmark."""
+    skills_dir = root / "skills"
+    for name, description in BENCH_SKILLS.items():
+        skill_dir = skills_dir / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"# {name}\n\n## Description\n{description}\n")
+
+    templates_dir = root / "agent-swarm" / "templates"
+    templates_dir.mkdir(parents=True)
+    for name in BENCH_TEMPLATES:
+        with open(templates_dir / f"{name}.json", "w") as f:
+            json.dump({
+                "name": name,
+                "role": name.replace("-", " ").title(),
+                "description": f"Bench {name}",
+                "system_prompt": f"You are the {name} bench agent.",
+            }, f)
+
+    return skills_dir, root / "agent-swarm"
+
+
+def build_orchestrator(root: Path) -> MasterSkillOrchestrator:
+    """Create an orchestrator wired to the fake provider, with every path under root."""
+    skills_dir, swarm_dir = build_workspace(root)
+
+    return MasterSkillOrchestrator(
+        discovery=SkillDiscovery(str(skills_dir), str(root / "orchestra")),
+        confidence_store=ConfidenceStore(str(root / "skill-confidence.db")),
+        cli_config={
+            provider: CLIConfig(CLIProvider.LOCAL, FAKE_COMMAND)
+            for provider in (CLIProvider.KIMI, CLIProvider.CODEX, CLIProvider.CLAUDE)
+        },
+        swarm=AgentSwarmExecutor(str(swarm_dir), cli_command=FAKE_COMMAND + ["-p"]),
+        pipeline_cache=PipelineCache(str(root / "pipeline-cache")),
+    )
+
+
+def run_benchmark(args) -> dict:
+    """Run all benchmark sections."""
+    os.environ["FAKE_PROVIDER_DELAY"] = str(args.delay)
+    os.environ["FAKE_PROVIDER_OUTPUT_BYTES"] = str(args.output_bytes)
+
+    report = {
+        "config": {
+            "delay": args.delay,
+            "output_bytes": args.output_bytes,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "context_bytes": args.context_bytes,
+        }
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator = build_orchestrator(Path(tmp))
+        context = {"shared": "c" * args.context_bytes}
+
+        # Baseline: the fake provider spawned directly, no orchestration
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            subprocess.run(FAKE_COMMAND + [BENCH_TASK], capture_output=True, text=True)
+            samples.append(time.perf_counter() - start)
+        baseline = statistics.median(samples)
+        report["baseline_subprocess"] = baseline
+
+        # CLIConfig.execute
+        config = orchestrator.cli_config[CLIProvider.CLAUDE]
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            config.execute(BENCH_TASK)
+            samples.append(time.perf_counter() - start)
+        report["cli_execute"] = summarize(samples, baseline)
+
+        # AgentSwarmExecutor.spawn_subagent with a shared context
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            orchestrator.swarm.spawn_subagent("ai-researcher", BENCH_TASK, context)
+            samples.append(time.perf_counter() - start)
+        report["spawn_subagent"] = summarize(samples, baseline)
+
+        # AgentSwarmExecutor.execute_parallel
+        n_tasks = args.concurrency * 4
+        tasks = [
+            {"template": BENCH_TEMPLATES[i % len(BENCH_TEMPLATES)], "task": BENCH_TASK, "context": context}
+            for i in range(n_tasks)
+        ]
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = orchestrator.swarm.execute_parallel(tasks, max_concurrent=args.concurrency)
+        wall = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        ideal = math.ceil(n_tasks / args.concurrency) * baseline
+        report["execute_parallel"] = {
+            "tasks": n_tasks,
+            "max_concurrent": args.concurrency,
+            "wall": wall,
+            "ideal": ideal,
+            "overhead": wall - ideal,
+            "throughput_per_s": n_tasks / wall,
+            "fairness": jain_index([r.execution_time for r in results]),
+            "failures": sum(1 for r in results if not r.success),
+            "peak_memory_per_task_kb": peak / n_tasks / 1024,
+        }
+
+        # MasterSkillOrchestrator.activate_for_task
+        report["activate_for_task"] = {}
+        for mode in ("cli", "parallel", "pipeline"):
+            samples = []
+            stages = 1
+            for i in range(args.iterations):
+                task = f"{BENCH_TASK} #{mode}-{i}"
+                start = time.perf_counter()
+                result = orchestrator.activate_for_task(task, mode=mode)
+                samples.append(time.perf_counter() - start)
+                if mode == "pipeline":
+                    stages = len(result.get("skills_used", [])) or 1
+            report["activate_for_task"][mode] = summarize(samples, baseline, stages * baseline)
+
+    return report
+
+
+def print_report(report: dict):
+    """Print a human-readable benchmark report."""
+    cfg = report["config"]
+    print(f"\n{'='*60}")
+    print(f"Orchestration Benchmark (delay={cfg['delay']}s, output={cfg['output_bytes']}B)")
+    print(f"{'='*60}")
+    print(f"Baseline (fake provider spawn): {report['baseline_subprocess']*1000:.1f}ms")
+
+    def row(name: str, data: dict):
+        print(f"  {name:<28} median {data['median']*1000:8.1f}ms  "
+              f"p95 {data['p95']*1000:8.1f}ms  overhead {data['overhead']*1000:+8.1f}ms")
+
+    print("\nPer-call overhead:")
+    row("CLIConfig.execute", report["cli_execute"])
+    row("spawn_subagent", report["spawn_subagent"])
+    for mode, data in report["activate_for_task"].items():
+        row(f"activate_for_task[{mode}]", data)
+
+    par = report["execute_parallel"]
+    print(f"\nexecute_parallel ({par['tasks']} tasks, {par['max_concurrent']} concurrent):")
+    print(f"  Wall: {par['wall']:.2f}s (ideal {par['ideal']:.2f}s, overhead {par['overhead']:+.2f}s)")
+    print(f"  Throughput: {par['throughput_per_s']:.1f} tasks/s")
+    print(f"  Fairness (Jain): {par['fairness']:.3f}")
+    print(f"  Peak memory per task: {par['peak_memory_per_task_kb']:.1f} KB")
+    print(f"  Failures: {par['failures']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Orchestration overhead benchmark")
+    parser.add_argument("--delay", type=float, default=0.05,
+                        help="Fake provider delay in seconds")
+    parser.add_argument("--output-bytes", type=int, default=1024,
+                        help="Fake provider output size")
+    parser.add_argument("--iterations", type=int, default=10,
+                        help="Samples per sequential measurement")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="max_concurrent for execute_parallel")
+    parser.add_argument("--context-bytes", type=int, default=100_000,
+                        help="Size of the shared context passed to subagents")
+    parser.add_argument("--json", action="store_true",
+                        help="Output report as JSON")
+
+    args = parser.parse_args()
+
+    if args.json:
+        # Keep orchestrator banners out of the JSON output
+        stdout = sys.stdout
+        sys.stdout = sys.stderr
+        report = run_benchmark(args)
+        sys.stdout = stdout
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
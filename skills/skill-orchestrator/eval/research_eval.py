@@ -12,12 +12,14 @@ Usage:
     python eval/research_eval.py --provider=codex
     python eval/research_eval.py --provider=claude
     python eval/research_eval.py --all
+    python eval/research_eval.py --all --workers=6 --per-provider=2 --resume
 """
 
 import json
 import time
 import subprocess
 import argparse
+import concurrent.futures
 from pathlib import Path
 from datetime import datetime
 
@@ -131,42 +133,122 @@ def evaluate_result(result: dict, prompt_info: dict) -> dict:
     }
 
 
-def run_evaluation(provider: str, output_dir: Path):
-    """Run evaluation for a specific provider."""
-    results = []
+def load_completed(output_dir: Path, provider: str) -> set[str]:
+    """Get prompt ids already recorded in a provider's results file."""
+    results_file = output_dir / f"results_{provider}.jsonl"
+    completed = set()
+    if not results_file.exists():
+        return completed
+    
+    with open(results_file, "r") as f:
+        for line in f:
+            try:
+                completed.add(json.loads(line)["prompt_id"])
+            except (json.JSONDecodeError, KeyError):
+                # Partial line from an interrupted run
+                continue
+    return completed
+
+
+def run_matrix(
+    providers: list[str],
+    output_dir: Path,
+    workers: int = 6,
+    per_provider: int = 2,
+    resume: bool = False
+) -> list[dict]:
+    """
+    Run the prompt x provider matrix on a worker pool.
+    
+    At most `per_provider` prompts run against one provider at a time.
+    Each result is appended to results_<provider>.jsonl as soon as it
+    finishes; with `resume`, pairs already in those files are skipped.
+    """
+    queues = {}
+    for provider in providers:
+        results_file = output_dir / f"results_{provider}.jsonl"
+        if resume:
+            completed = load_completed(output_dir, provider)
+            # Terminate a partial trailing line so new results start cleanly
+            if results_file.exists() and not results_file.read_bytes().endswith(b"\n"):
+                if results_file.stat().st_size:
+                    with open(results_file, "a") as f:
+                        f.write("\n")
+        else:
+            completed = set()
+            results_file.write_text("")
+        
+        queues[provider] = [
+            (key, info) for key, info in PROMPTS.items()
+            if info["id"] not in completed
+        ]
+        skipped = len(PROMPTS) - len(queues[provider])
+        if skipped:
+            print(f"[{provider}] Resuming: {skipped} prompts already completed")
     
+    total = sum(len(q) for q in queues.values())
     print(f"\n{'='*60}")
-    print(f"Evaluating: {provider.upper()}")
+    print(f"Evaluating: {', '.join(p.upper() for p in providers)} ({total} runs)")
     print(f"{'='*60}")
     
-    for key, prompt_info in PROMPTS.items():
-        print(f"\n[{key}] Running...")
-        
-        result = execute_prompt(prompt_info["prompt"], provider)
-        evaluation = evaluate_result(result, prompt_info)
-        evaluation["provider"] = provider
-        
-        results.append(evaluation)
+    results = []
+    in_flight = {provider: 0 for provider in providers}
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {}
         
-        print(f"  Time: {result['execution_time']:.1f}s")
-        print(f"  Length: {result['output_length']} chars")
-        print(f"  Success: {result['success']}")
+        def schedule():
+            # Round-robin across providers so one slow provider can't hog the pool
+            scheduled = True
+            while scheduled and len(running) < workers:
+                scheduled = False
+                for provider in providers:
+                    if len(running) >= workers:
+                        break
+                    if queues[provider] and in_flight[provider] < per_provider:
+                        key, info = queues[provider].pop(0)
+                        future = executor.submit(execute_prompt, info["prompt"], provider)
+                        running[future] = (provider, key, info)
+                        in_flight[provider] += 1
+                        scheduled = True
         
-        # Save individual result
-        output_file = output_dir / f"{provider}_{key}.json"
-        with open(output_file, "w") as f:
-            json.dump(evaluation, f, indent=2)
+        schedule()
+        while running:
+            finished, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in finished:
+                provider, key, prompt_info = running.pop(future)
+                in_flight[provider] -= 1
+                
+                result = future.result()
+                evaluation = evaluate_result(result, prompt_info)
+                evaluation["provider"] = provider
+                results.append(evaluation)
+                
+                print(f"\n[{provider}/{key}] {result['execution_time']:.1f}s, "
+                      f"{result['output_length']} chars, success={result['success']}")
+                
+                # Save individual result
+                with open(output_dir / f"{provider}_{key}.json", "w") as f:
+                    json.dump(evaluation, f, indent=2)
+                
+                # Stream to combined results
+                with open(output_dir / f"results_{provider}.jsonl", "a") as f:
+                    f.write(json.dumps(evaluation) + "\n")
+            
+            schedule()
     
-    # Save combined results
-    results_file = output_dir / f"results_{provider}.jsonl"
-    with open(results_file, "w") as f:
-        for r in results:
-            f.write(json.dumps(r) + "\n")
-    
-    print(f"\nResults saved to: {results_file}")
+    for provider in providers:
+        print(f"\nResults saved to: {output_dir / f'results_{provider}.jsonl'}")
     return results
 
 
+def run_evaluation(provider: str, output_dir: Path, resume: bool = False):
+    """Run evaluation for a specific provider."""
+    return run_matrix([provider], output_dir, resume=resume)
+
+
 def aggregate_results(output_dir: Path) -> dict:
     """Aggregate results from all providers."""
     all_results = {}
@@ -174,11 +256,16 @@ def aggregate_results(output_dir: Path) -> dict:
     for provider in ["kimi", "codex", "claude"]:
         results_file = output_dir / f"results_{provider}.jsonl"
         if results_file.exists():
-            results = []
+            # Keep the latest result per prompt (resumed runs may repeat one)
+            by_prompt = {}
             with open(results_file, "r") as f:
                 for line in f:
-                    results.append(json.loads(line))
-            all_results[provider] = results
+                    try:
+                        result = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    by_prompt[result["prompt_id"]] = result
+            all_results[provider] = list(by_prompt.values())
     
     # Generate summary
     summary = {
@@ -218,6 +305,12 @@ def main():
                         help="Aggregate existing results")
     parser.add_argument("--output", default="eval/results",
                         help="Output directory")
+    parser.add_argument("--workers", type=int, default=6,
+                        help="Maximum concurrent prompt executions")
+    parser.add_argument("--per-provider", type=int, default=2,
+                        help="Maximum concurrent executions per provider")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip (prompt, provider) pairs already in results files")
     
     args = parser.parse_args()
     
@@ -228,11 +321,12 @@ def main():
         summary = aggregate_results(output_dir)
         print(json.dumps(summary["comparisons"], indent=2))
     elif args.all:
-        for provider in ["kimi", "codex", "claude"]:
-            run_evaluation(provider, output_dir)
+        run_matrix(["kimi", "codex", "claude"], output_dir,
+                   args.workers, args.per_provider, args.resume)
         aggregate_results(output_dir)
     elif args.provider:
-        run_evaluation(args.provider, output_dir)
+        run_matrix([args.provider], output_dir,
+                   args.workers, args.per_provider, args.resume)
     else:
         print("Usage: python eval/research_eval.py --provider=kimi --all --aggregate")
 
@@ -11,13 +11,20 @@ Unified orchestration for 120+ skills with real execution via:
 from .orchestrator import (
     MasterSkillOrchestrator,
     SkillRegistry,
+    ConfidenceStore,
     SkillDiscovery,
     Skill,
     ExecutionResult,
     SkillSource,
     CLIProvider,
     CLIConfig,
+    ProviderRouter,
+    ProviderStats,
+    SwarmTemplate,
     AgentSwarmExecutor,
+    PipelineStage,
+    PipelineCache,
+    SkillPipeline,
     Complexity,
     ExecutionMode,
     create_orchestrator
@@ -27,13 +34,20 @@ __version__ = "2.0.0"
 __all__ = [
     "MasterSkillOrchestrator",
     "SkillRegistry",
+    "ConfidenceStore",
     "SkillDiscovery",
     "Skill",
     "ExecutionResult",
     "SkillSource",
     "CLIProvider",
     "CLIConfig",
+    "ProviderRouter",
+    "ProviderStats",
+    "SwarmTemplate",
     "AgentSwarmExecutor",
+    "PipelineStage",
+    "PipelineCache",
+    "SkillPipeline",
     "Complexity",
     "ExecutionMode",
     "create_orchestrator"
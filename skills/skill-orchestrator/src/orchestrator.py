@@ -10,10 +10,19 @@ Unified orchestration for 120+ skills with real execution via:
 
 import json
 import time
+import atexit
+import random
+import sqlite3
 import asyncio
+import hashlib
+import threading
 import subprocess
+import concurrent.futures
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 import re
@@ -97,7 +106,7 @@ class ExecutionResult:
 class CLIConfig:
     """Configuration for CLI execution."""
     provider: CLIProvider
-    command: str
+    command: str | list[str]
     timeout: int = 300
     non_interactive: bool = True
     
@@ -156,52 +165,280 @@ class CLIConfig:
             return ["codex", "-p", prompt]
         elif self.provider == CLIProvider.CLAUDE:
             return ["claude", "-p", prompt]
+        elif isinstance(self.command, list):
+            return [*self.command, prompt]
         else:
             return [self.command, prompt]
 
 
+@dataclass
+class ProviderStats:
+    """Exponentially decayed latency and success statistics for a provider."""
+    latency: float = 0.0
+    success_latency: float = 0.0
+    failure_latency: float = 0.0
+    success_rate: float = 1.0
+    samples: int = 0
+    successes: int = 0
+    failures: int = 0
+    last_updated: float = 0.0
+    
+    def observe(self, execution_time: float, success: bool, decay: float, timestamp: float = None):
+        """Fold one execution into the decayed averages."""
+        outcome = 1.0 if success else 0.0
+        if self.samples == 0:
+            self.latency = execution_time
+            self.success_rate = outcome
+        else:
+            self.latency = decay * self.latency + (1 - decay) * execution_time
+            self.success_rate = decay * self.success_rate + (1 - decay) * outcome
+        
+        if success:
+            self.success_latency = (execution_time if self.successes == 0
+                                    else decay * self.success_latency + (1 - decay) * execution_time)
+            self.successes += 1
+        else:
+            self.failure_latency = (execution_time if self.failures == 0
+                                    else decay * self.failure_latency + (1 - decay) * execution_time)
+            self.failures += 1
+        
+        self.samples += 1
+        self.last_updated = timestamp or time.time()
+    
+    def expected_completion_time(self, failure_cost: float = 0.0) -> float:
+        """
+        Expected time to a successful result, counting retries after failures.
+        
+        Each failure costs at least failure_cost seconds, so a provider that
+        fails fast (e.g. a missing binary) cannot look cheaper than a slow
+        one that succeeds.
+        """
+        success_rate = max(self.success_rate, 0.05)
+        cost = max(self.failure_latency, failure_cost)
+        success_latency = self.success_latency if self.successes else cost
+        return success_latency + (1 - success_rate) / success_rate * cost
+
+
+class ProviderRouter:
+    """
+    Adaptive provider routing fed by the execution log.
+    
+    Keeps decayed statistics per provider and per (provider, skill category)
+    and routes each task to the provider with the lowest expected completion
+    time. A small exploration rate keeps stats fresh for slower providers.
+    
+    A failure is charged failure_cost seconds, or by default the slowest
+    success latency observed across providers.
+    """
+    
+    ALL_CATEGORIES = "*"
+    
+    def __init__(
+        self,
+        providers: list[str],
+        decay: float = 0.8,
+        exploration_rate: float = 0.05,
+        min_samples: int = 3,
+        failure_cost: float = None,
+        seed: int = None
+    ):
+        self.providers = list(providers)
+        self.decay = decay
+        self.exploration_rate = exploration_rate
+        self.min_samples = min_samples
+        self.failure_cost = failure_cost
+        self.stats: dict[tuple[str, str], ProviderStats] = {}
+        self._rng = random.Random(seed)
+    
+    def observe(self, entry: dict):
+        """Update statistics from an execution log entry."""
+        provider = entry.get("provider")
+        if provider not in self.providers:
+            return
+        
+        keys = {(provider, self.ALL_CATEGORIES)}
+        if entry.get("category"):
+            keys.add((provider, entry["category"]))
+        
+        for key in keys:
+            if key not in self.stats:
+                self.stats[key] = ProviderStats()
+            self.stats[key].observe(
+                entry.get("execution_time", 0.0),
+                entry.get("success", False),
+                self.decay,
+                entry.get("timestamp")
+            )
+    
+    def rebuild(self, execution_log: list[dict]):
+        """Recompute statistics from a full execution log."""
+        self.stats = {}
+        for entry in execution_log:
+            self.observe(entry)
+    
+    def expected_completion_time(self, provider: str, category: str = None) -> float | None:
+        """Expected completion time, falling back to provider-wide stats."""
+        stats = self.stats.get((provider, category)) if category else None
+        if stats is None or stats.samples < self.min_samples:
+            stats = self.stats.get((provider, self.ALL_CATEGORIES))
+        if stats is None:
+            return None
+        return stats.expected_completion_time(self._failure_cost())
+    
+    def _failure_cost(self) -> float:
+        """Seconds charged per failure: configured, else slowest success seen."""
+        if self.failure_cost is not None:
+            return self.failure_cost
+        return max(
+            (stats.success_latency for (_, category), stats in self.stats.items()
+             if category == self.ALL_CATEGORIES and stats.successes),
+            default=0.0
+        )
+    
+    def select(self, category: str = None) -> str:
+        """Select a provider for a task in the given category."""
+        unseen = [p for p in self.providers if (p, self.ALL_CATEGORIES) not in self.stats]
+        if unseen:
+            return self._rng.choice(unseen)
+        
+        if self._rng.random() < self.exploration_rate:
+            return self._rng.choice(self.providers)
+        
+        return min(self.providers, key=lambda p: self.expected_completion_time(p, category))
+    
+    def snapshot(self) -> dict:
+        """Get current routing statistics."""
+        snapshot = {}
+        failure_cost = self._failure_cost()
+        for (provider, category), stats in self.stats.items():
+            snapshot.setdefault(provider, {})[category] = {
+                "latency": stats.latency,
+                "success_latency": stats.success_latency,
+                "failure_latency": stats.failure_latency,
+                "success_rate": stats.success_rate,
+                "samples": stats.samples,
+                "expected_completion_time": stats.expected_completion_time(failure_cost)
+            }
+        return snapshot
+
+
+@dataclass(frozen=True)
+class SwarmTemplate:
+    """A frozen subagent template with its prompt prefix pre-rendered."""
+    name: str
+    role: str
+    description: str
+    tools: tuple[str, ...]
+    max_steps: int
+    system_prompt: str
+    prompt_prefix: str
+    source_path: str
+    mtime_ns: int
+    
+    @classmethod
+    def from_file(cls, path: Path) -> "SwarmTemplate":
+        """Load and pre-render a template JSON file."""
+        with open(path) as f:
+            data = json.load(f)
+        system_prompt = data.get("system_prompt", "")
+        return cls(
+            name=data["name"],
+            role=data.get("role", "Agent"),
+            description=data.get("description", ""),
+            tools=tuple(data.get("tools", [])),
+            max_steps=data.get("max_steps", 50),
+            system_prompt=system_prompt,
+            prompt_prefix=f"{system_prompt}\n\nTask: ",
+            source_path=str(path),
+            mtime_ns=path.stat().st_mtime_ns
+        )
+    
+    def render(self, task: str, context_json: str = None) -> str:
+        """Build the full subagent prompt."""
+        prompt = self.prompt_prefix + task
+        if context_json:
+            prompt += f"\n\nContext: {context_json}"
+        return prompt
+
+
 class AgentSwarmExecutor:
     """Execute tasks via Agent Swarm."""
     
-    def __init__(self, swarm_path: str = None):
+    def __init__(
+        self,
+        swarm_path: str = None,
+        cli_command: list[str] = None,
+        reload_interval: float = 1.0
+    ):
         if swarm_path is None:
             self.swarm_path = Path("/Users/jasontang/clawd/skills/agent-swarm")
         else:
             self.swarm_path = Path(swarm_path)
         
+        # Subagents run via Claude CLI by default; could also use kimi or codex
+        self.cli_command = cli_command or ["claude", "-p"]
+        
         self.templates_path = self.swarm_path / "templates"
         self.scripts_path = self.swarm_path / "scripts"
         self.state_file = self.swarm_path / "memory" / "swarm-state.json"
         
-        # Load templates
-        self.templates = self._load_templates()
+        # Templates are loaded once and reloaded only when a file's mtime changes
+        self.reload_interval = reload_interval
+        self._template_files: dict[Path, SwarmTemplate] = {}
+        self._last_reload_check = 0.0
+        self._templates_lock = threading.Lock()
+        self.templates: dict[str, SwarmTemplate] = {}
+        self._load_templates()
     
-    def _load_templates(self) -> dict:
-        """Load subagent templates."""
-        templates = {}
-        if self.templates_path.exists():
-            for template_file in self.templates_path.glob("*.json"):
-                if template_file.name.endswith(".json") and not template_file.name.startswith("night"):
+    def _load_templates(self) -> dict[str, SwarmTemplate]:
+        """Load subagent templates, re-reading only files that changed."""
+        with self._templates_lock:
+            self._last_reload_check = time.monotonic()
+            
+            current = {}
+            if self.templates_path.exists():
+                for template_file in self.templates_path.glob("*.json"):
+                    if template_file.name.startswith("night"):
+                        continue
+                    try:
+                        mtime_ns = template_file.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    
+                    cached = self._template_files.get(template_file)
+                    if cached and cached.mtime_ns == mtime_ns:
+                        current[template_file] = cached
+                        continue
+                    
                     try:
-                        template = json.load(open(template_file))
-                        templates[template["name"]] = template
-                    except json.JSONDecodeError:
+                        current[template_file] = SwarmTemplate.from_file(template_file)
+                    except (json.JSONDecodeError, KeyError, OSError):
                         pass
-        return templates
+            
+            self._template_files = current
+            self.templates = {t.name: t for t in current.values()}
+            return self.templates
     
-    def get_template(self, name: str) -> dict | None:
+    def _refresh_templates(self):
+        """Hot-reload templates at most once per reload interval."""
+        if time.monotonic() - self._last_reload_check >= self.reload_interval:
+            self._load_templates()
+    
+    def get_template(self, name: str) -> SwarmTemplate | None:
         """Get a subagent template."""
+        self._refresh_templates()
         return self.templates.get(name)
     
     def list_templates(self) -> list[dict]:
         """List all available templates."""
+        self._refresh_templates()
         return [
             {
                 "name": name,
-                "role": t.get("role", "Unknown"),
-                "description": t.get("description", ""),
-                "tools": t.get("tools", []),
-                "max_steps": t.get("max_steps", 50)
+                "role": t.role,
+                "description": t.description,
+                "tools": list(t.tools),
+                "max_steps": t.max_steps
             }
             for name, t in self.templates.items()
         ]
@@ -213,6 +450,15 @@ class AgentSwarmExecutor:
         context: dict = None
     ) -> ExecutionResult:
         """Spawn a subagent using a template."""
+        return self._spawn(template_name, task, json.dumps(context) if context else None)
+    
+    def _spawn(
+        self,
+        template_name: str,
+        task: str,
+        context_json: str = None
+    ) -> ExecutionResult:
+        """Spawn a subagent with an already serialized context."""
         start_time = time.perf_counter()
         
         template = self.get_template(template_name)
@@ -224,20 +470,11 @@ class AgentSwarmExecutor:
                 error=f"Template '{template_name}' not found"
             )
         
-        # Build system prompt from template
-        system_prompt = template.get("system_prompt", "")
-        role = template.get("role", "Agent")
-        
-        # Construct full prompt
-        full_prompt = f"{system_prompt}\n\nTask: {task}"
-        if context:
-            full_prompt += f"\n\nContext: {json.dumps(context)}"
+        full_prompt = template.render(task, context_json)
         
-        # Execute using Claude CLI (default for now)
-        # Could also use kimi or codex
         try:
             result = subprocess.run(
-                ["claude", "-p", full_prompt],
+                [*self.cli_command, full_prompt],
                 capture_output=True,
                 text=True,
                 timeout=300
@@ -265,15 +502,29 @@ class AgentSwarmExecutor:
         tasks: list[dict],
         max_concurrent: int = 5
     ) -> list[ExecutionResult]:
-        """Execute multiple subagents in parallel."""
+        """
+        Execute multiple subagents in parallel.
+        
+        A context object shared by several tasks is serialized once, up
+        front, for this call only; later calls serialize it again, so
+        callers may mutate a context between calls.
+        """
         results = []
         
-        # Use ThreadPoolExecutor for parallelism
-        import concurrent.futures
+        serialized: dict[int, str] = {}
+        for task in tasks:
+            context = task.get("context")
+            if context and id(context) not in serialized:
+                serialized[id(context)] = json.dumps(context)
         
         def run_task(task: dict) -> ExecutionResult:
             template = task.get("template", "ai-researcher")
-            return self.spawn_subagent(template, task.get("task", ""))
+            context = task.get("context")
+            return self._spawn(
+                template,
+                task.get("task", ""),
+                serialized[id(context)] if context else None
+            )
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent) as executor:
             futures = {executor.submit(run_task, t): t for t in tasks}
@@ -291,12 +542,297 @@ class AgentSwarmExecutor:
         return results
 
 
+@dataclass
+class PipelineStage:
+    """A single stage of a skill pipeline."""
+    name: str
+    skill: Skill
+    depends_on: list[str] = field(default_factory=list)
+
+
+class PipelineCache:
+    """
+    Disk-backed cache of successful stage results, for resuming failed runs.
+    
+    Keys cover the task, the stage and its upstream outputs, so rerunning a
+    failed pipeline resumes from the first stage whose inputs changed. A
+    pipeline that fully succeeds discards its entries; anything left over
+    expires after ttl seconds, and the oldest files beyond max_entries are
+    pruned on write.
+    """
+    
+    def __init__(self, cache_dir: str = None, ttl: float = 24 * 3600, max_entries: int = 256):
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent / "memory" / "pipeline-cache"
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory: dict[str, tuple[float, ExecutionResult]] = {}
+        self._lock = threading.Lock()
+    
+    def key(self, task: str, stage: PipelineStage, upstream: dict) -> str:
+        """Compute the cache key for a stage execution."""
+        payload = json.dumps(
+            [task, stage.name, stage.skill.name, upstream],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> ExecutionResult | None:
+        """Get a cached stage result that has not expired."""
+        with self._lock:
+            entry = self._memory.get(key)
+        
+        if entry is None:
+            cache_file = self.cache_dir / f"{key}.json"
+            if not cache_file.exists():
+                return None
+            try:
+                with open(cache_file) as f:
+                    data = json.load(f)
+                entry = (float(data["created_at"]), ExecutionResult(**data["result"]))
+            except (json.JSONDecodeError, TypeError, KeyError, ValueError, OSError):
+                self.discard([key])
+                return None
+            with self._lock:
+                self._memory[key] = entry
+        
+        created_at, result = entry
+        if time.time() - created_at > self.ttl:
+            self.discard([key])
+            return None
+        return result
+    
+    def put(self, key: str, result: ExecutionResult):
+        """Cache a successful stage result."""
+        if not result.success:
+            return
+        
+        created_at = time.time()
+        with self._lock:
+            self._memory[key] = (created_at, result)
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_dir / f"{key}.json.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"created_at": created_at, "result": result.__dict__}, f, default=str)
+        tmp_file.replace(self.cache_dir / f"{key}.json")
+        self._prune()
+    
+    def discard(self, keys: list[str]):
+        """Drop entries from memory and disk."""
+        with self._lock:
+            for key in keys:
+                self._memory.pop(key, None)
+        for key in keys:
+            try:
+                (self.cache_dir / f"{key}.json").unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _prune(self):
+        """Delete the oldest cache files beyond max_entries."""
+        files = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                files.append((cache_file.stat().st_mtime, cache_file))
+            except FileNotFoundError:
+                continue
+        
+        excess = len(files) - self.max_entries
+        if excess > 0:
+            files.sort()
+            self.discard([cache_file.stem for _, cache_file in files[:excess]])
+
+
+class SkillPipeline:
+    """
+    Dependency-driven skill pipeline.
+    
+    Each stage runs as soon as all of its dependencies have finished, with
+    their outputs in its context. Independent stages run concurrently.
+    Stages downstream of a failure are skipped. With resume, stages cached
+    by an earlier failed run are not rerun; once every stage succeeds the
+    run's cache entries are discarded.
+    """
+    
+    def __init__(
+        self,
+        stages: list[PipelineStage],
+        execute: Callable[[PipelineStage, dict], ExecutionResult],
+        cache: PipelineCache = None,
+        max_concurrent: int = 5
+    ):
+        self.stages = {stage.name: stage for stage in stages}
+        self.execute = execute
+        self.cache = cache
+        self.max_concurrent = max_concurrent
+        self.resumed: list[str] = []
+        self._cache_keys: list[str] = []
+        self._resume = True
+        self._validate()
+    
+    def _validate(self):
+        """Reject unknown dependencies and cycles."""
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+        
+        visiting, done = set(), set()
+        
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline has a dependency cycle through '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in self.stages:
+            visit(name)
+    
+    @classmethod
+    def chain(cls, skills: list[Skill], **kwargs) -> "SkillPipeline":
+        """Build a linear pipeline where each skill feeds the next."""
+        stages = []
+        for skill in skills:
+            depends_on = [stages[-1].name] if stages else []
+            stages.append(PipelineStage(skill.name, skill, depends_on))
+        return cls(stages, **kwargs)
+    
+    def run(self, task: str, context: dict = None, resume: bool = True) -> dict[str, ExecutionResult]:
+        """Run all stages and return their results by stage name."""
+        results: dict[str, ExecutionResult] = {}
+        self.resumed = []
+        self._cache_keys = []
+        self._resume = resume
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+            running = {}
+            
+            while len(results) < len(self.stages):
+                for name, stage in self.stages.items():
+                    if name in results or name in running.values():
+                        continue
+                    if not all(dep in results for dep in stage.depends_on):
+                        continue
+                    
+                    failed = [dep for dep in stage.depends_on if not results[dep].success]
+                    if failed:
+                        results[name] = ExecutionResult(
+                            success=False,
+                            skill_name=stage.skill.name,
+                            provider="pipeline",
+                            error=f"Skipped: upstream stage '{failed[0]}' failed"
+                        )
+                        continue
+                    
+                    future = executor.submit(self._run_stage, task, stage, context, results)
+                    running[future] = name
+                
+                if not running:
+                    continue
+                
+                finished, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = ExecutionResult(
+                            success=False,
+                            skill_name=self.stages[name].skill.name,
+                            provider="pipeline",
+                            error=str(e)
+                        )
+        
+        # Cached stages only exist to resume a failed run
+        if self.cache and all(result.success for result in results.values()):
+            self.cache.discard(self._cache_keys)
+        
+        return {name: results[name] for name in self.stages}
+    
+    def _run_stage(
+        self,
+        task: str,
+        stage: PipelineStage,
+        context: dict,
+        results: dict[str, ExecutionResult]
+    ) -> ExecutionResult:
+        """Run one stage, reusing a cached result when available."""
+        upstream = {dep: results[dep].output for dep in stage.depends_on}
+        
+        key = None
+        if self.cache:
+            key = self.cache.key(task, stage, upstream)
+            self._cache_keys.append(key)
+            cached = self.cache.get(key) if self._resume else None
+            if cached:
+                self.resumed.append(stage.name)
+                return cached
+        
+        stage_context = dict(context or {})
+        stage_context["pipeline_task"] = task
+        stage_context["upstream"] = upstream
+        result = self.execute(stage, stage_context)
+        
+        if self.cache:
+            self.cache.put(key, result)
+        return result
+
+
+# Local skill categories in priority order: the first category with a
+# keyword in the skill's name or description wins.
+CATEGORY_KEYWORDS = {
+    "DevOps": ["deployment", "devops", "docker", "kubernetes"],
+    "Frontend": ["react", "frontend", "ui", "css", "html"],
+    "Database": ["database", "sql", "postgres", "supabase"],
+    "Authentication": ["auth", "login", "security"],
+    "Testing": ["test", "testing", "coverage"],
+    "Research": ["research", "analysis", "paper"],
+    "Documentation": ["document", "write", "read"],
+}
+
+_CATEGORY_PRIORITY: dict[str, tuple[int, str]] = {}
+for _priority, (_cat, _keywords) in enumerate(CATEGORY_KEYWORDS.items()):
+    for _kw in _keywords:
+        _CATEGORY_PRIORITY.setdefault(_kw, (_priority, _cat))
+
+# Zero-width lookahead so overlapping keywords are all seen in one pass
+_CATEGORY_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_CATEGORY_PRIORITY, key=len, reverse=True)) + "))"
+)
+
+
+@lru_cache(maxsize=4096)
+def _categorize_text(text: str) -> str:
+    """Categorize lowercase skill text in a single regex pass."""
+    best = None
+    for match in _CATEGORY_PATTERN.finditer(text):
+        candidate = _CATEGORY_PRIORITY[match.group(1)]
+        if best is None or candidate < best:
+            best = candidate
+            if best[0] == 0:
+                break
+    return best[1] if best else "General"
+
+
 class SkillDiscovery:
     """Discovers and indexes skills from multiple sources."""
     
-    def __init__(self):
-        self.local_skills_path = Path("/Users/jasontang/clawd/skills")
-        self.orchestra_skills_path = Path.home() / ".orchestra" / "skills"
+    def __init__(self, local_skills_path: str = None, orchestra_skills_path: str = None):
+        self.local_skills_path = Path(local_skills_path or "/Users/jasontang/clawd/skills")
+        self.orchestra_skills_path = (
+            Path(orchestra_skills_path) if orchestra_skills_path
+            else Path.home() / ".orchestra" / "skills"
+        )
         self.discovered_skills: dict[str, Skill] = {}
     
     def discover_all(self) -> dict[str, Skill]:
@@ -443,45 +979,154 @@ class SkillDiscovery:
     
     def _categorize_skill(self, name: str, description: str) -> str:
         """Categorize a local skill."""
-        text = f"{name} {description}".lower()
-        
-        categories = {
-            "DevOps": ["deployment", "devops", "docker", "kubernetes"],
-            "Frontend": ["react", "frontend", "ui", "css", "html"],
-            "Database": ["database", "sql", "postgres", "supabase"],
-            "Authentication": ["auth", "login", "security"],
-            "Testing": ["test", "testing", "coverage"],
-            "Research": ["research", "analysis", "paper"],
-            "Documentation": ["document", "write", "read"],
-        }
+        return _categorize_text(f"{name} {description}".lower())
+
+
+class ConfidenceStore:
+    """
+    Durable per-skill confidence, usage count and last_used (SQLite, WAL mode).
+    
+    Updates are buffered as deltas and written in batches. Deltas are applied
+    in SQL, so concurrent orchestrator processes don't overwrite each other.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = None,
+        flush_every: int = 20,
+        flush_interval: float = 5.0
+    ):
+        if db_path is None:
+            db_path = Path(__file__).parent.parent / "memory" / "skill-confidence.db"
+        self.db_path = Path(db_path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        
+        # name -> [baseline confidence, confidence delta, usage delta, last_used]
+        self._pending: dict[str, list] = {}
+        # Updates buffered since the last flush (a skill can appear many times)
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS skill_confidence ("
+                "name TEXT PRIMARY KEY, "
+                "confidence REAL NOT NULL, "
+                "usage_count INTEGER NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+        
+        atexit.register(self.flush)
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection that waits on other writers; commits on success, always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def record(self, name: str, baseline: float, delta: float, last_used: float):
+        """Buffer one confidence update; flushes when the batch is full or stale."""
+        with self._lock:
+            if name in self._pending:
+                pending = self._pending[name]
+                pending[1] += delta
+                pending[2] += 1
+                pending[3] = max(pending[3], last_used)
+            else:
+                self._pending[name] = [baseline, delta, 1, last_used]
+            self._buffered += 1
+            
+            due = (
+                self._buffered >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
         
-        for cat, keywords in categories.items():
-            if any(kw in text for kw in keywords):
-                return cat
-        return "General"
+        if due:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered updates in one transaction."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._buffered = 0
+            self._last_flush = time.monotonic()
+        
+        if not pending:
+            return
+        
+        rows = [
+            {"name": name, "baseline": baseline, "delta": delta, "uses": uses, "last_used": last_used}
+            for name, (baseline, delta, uses, last_used) in pending.items()
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO skill_confidence (name, confidence, usage_count, last_used) "
+                "VALUES (:name, MIN(1.0, MAX(0.1, :baseline + :delta)), :uses, :last_used) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "confidence = MIN(1.0, MAX(0.1, confidence + :delta)), "
+                "usage_count = usage_count + :uses, "
+                "last_used = MAX(last_used, :last_used)",
+                rows
+            )
+    
+    def load_all(self) -> dict[str, tuple[float, int, float]]:
+        """Get (confidence, usage_count, last_used) for every stored skill."""
+        self.flush()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, confidence, usage_count, last_used FROM skill_confidence"
+            ).fetchall()
+        return {name: (confidence, usage, last_used) for name, confidence, usage, last_used in rows}
 
 
 class SkillRegistry:
     """Unified registry of all skills."""
     
-    def __init__(self, discovery: SkillDiscovery = None):
+    def __init__(self, discovery: SkillDiscovery = None, store: ConfidenceStore = None):
         self.skills: dict[str, Skill] = {}
         self.by_category: dict[str, list[str]] = {}
         self.discovery = discovery or SkillDiscovery()
+        self.store = store
+        
+        # Running aggregates so statistics don't scan every skill
+        self.source_counts: Counter = Counter()
+        self.category_counts: Counter = Counter()
+        self._confidence_sum = 0.0
     
     def load(self) -> dict[str, Skill]:
-        """Load all skills."""
+        """Load all skills, restoring learned confidence from the store."""
         self.skills = self.discovery.discover_all()
+        if self.store:
+            for name, (confidence, usage_count, last_used) in self.store.load_all().items():
+                skill = self.skills.get(name)
+                if skill:
+                    skill.confidence = confidence
+                    skill.usage_count = usage_count
+                    skill.last_used = last_used
         self._build_category_index()
         return self.skills
     
     def _build_category_index(self):
-        """Build index by category."""
+        """Build index by category along with source and confidence aggregates."""
         self.by_category = {}
+        self.source_counts = Counter()
+        self.category_counts = Counter()
+        self._confidence_sum = 0.0
         for skill in self.skills.values():
             if skill.category not in self.by_category:
                 self.by_category[skill.category] = []
             self.by_category[skill.category].append(skill.name)
+            self.source_counts[skill.source] += 1
+            self.category_counts[skill.category] += 1
+            self._confidence_sum += skill.confidence
     
     def get(self, name: str) -> Skill | None:
         """Get a skill by name."""
@@ -532,20 +1177,25 @@ class SkillRegistry:
         
         skill = self.skills[name]
         delta = 0.05 if success else -0.05
+        old_confidence = skill.confidence
         skill.confidence = max(0.1, min(1.0, skill.confidence + delta))
+        self._confidence_sum += skill.confidence - old_confidence
         skill.usage_count += 1
         skill.last_used = time.time()
+        
+        if self.store:
+            self.store.record(name, old_confidence, skill.confidence - old_confidence, skill.last_used)
     
     def get_statistics(self) -> dict:
         """Get registry statistics."""
         return {
             "total_skills": len(self.skills),
             "by_source": {
-                "local": len([s for s in self.skills.values() if s.source == SkillSource.LOCAL]),
-                "orchestra": len([s for s in self.skills.values() if s.source == SkillSource.ORCHESTRA]),
+                "local": self.source_counts[SkillSource.LOCAL],
+                "orchestra": self.source_counts[SkillSource.ORCHESTRA],
             },
-            "by_category": {cat: len(names) for cat, names in self.by_category.items()},
-            "avg_confidence": sum(s.confidence for s in self.skills.values()) / len(self.skills) if self.skills else 0
+            "by_category": dict(self.category_counts),
+            "avg_confidence": self._confidence_sum / len(self.skills) if self.skills else 0
         }
     
     def list_categories(self) -> list[str]:
@@ -562,24 +1212,44 @@ class MasterSkillOrchestrator:
     - Codex CLI
     - Claude Code CLI
     - Agent Swarm (parallel subagents)
+    
+    Collaborators default to the real skill roots and memory/ stores; pass
+    them in to run against other paths (e.g. a benchmark temp dir).
     """
     
-    def __init__(self):
-        self.discovery = SkillDiscovery()
-        self.registry = SkillRegistry(self.discovery)
+    def __init__(
+        self,
+        discovery: SkillDiscovery = None,
+        confidence_store: ConfidenceStore = None,
+        cli_config: dict[CLIProvider, CLIConfig] = None,
+        swarm: AgentSwarmExecutor = None,
+        pipeline_cache: PipelineCache = None
+    ):
+        self.discovery = discovery or SkillDiscovery()
+        self.registry = SkillRegistry(self.discovery, confidence_store or ConfidenceStore())
         self.registry.load()
         
         # Initialize executors
-        self.cli_config = {
+        self.cli_config = cli_config or {
             CLIProvider.KIMI: CLIConfig(CLIProvider.KIMI, "kimi"),
             CLIProvider.CODEX: CLIConfig(CLIProvider.CODEX, "codex"),
             CLIProvider.CLAUDE: CLIConfig(CLIProvider.CLAUDE, "claude"),
         }
         
-        self.swarm = AgentSwarmExecutor()
+        self.swarm = swarm or AgentSwarmExecutor()
         
         # Execution log
         self.execution_log: list[dict] = []
+        self._log_lock = threading.Lock()
+        
+        # Adaptive routing, fed by the execution log
+        self.router = ProviderRouter([p.value for p in self.cli_config])
+        
+        # Stage results for resumable pipelines
+        self.pipeline_cache = pipeline_cache or PipelineCache()
+        
+        # Swarm template resolved per category
+        self._template_cache: dict[str, str] = {}
         
         print(f"Master Skill Orchestrator v2.0")
         print(f"=" * 60)
@@ -595,10 +1265,22 @@ class MasterSkillOrchestrator:
         self,
         task: str,
         provider: str = "claude",
-        context: dict = None
+        context: dict = None,
+        category: str = None
     ) -> ExecutionResult:
-        """Execute a task via CLI provider."""
-        provider_enum = CLIProvider(provider.lower())
+        """
+        Execute a task via CLI provider.
+        
+        Pass provider="adaptive" to let the router pick the provider with
+        the best expected completion time for the skill category.
+        """
+        if provider.lower() == "adaptive":
+            provider = self.router.select(category)
+        
+        try:
+            provider_enum = CLIProvider(provider.lower())
+        except ValueError:
+            provider_enum = None
         
         if provider_enum not in self.cli_config:
             return ExecutionResult(
@@ -612,13 +1294,17 @@ class MasterSkillOrchestrator:
         result = config.execute(task, context)
         
         # Log execution
-        self.execution_log.append({
+        entry = {
             "timestamp": time.time(),
             "task": task,
             "provider": provider,
+            "category": category,
             "success": result.success,
             "execution_time": result.execution_time
-        })
+        }
+        with self._log_lock:
+            self.execution_log.append(entry)
+            self.router.observe(entry)
         
         return result
     
@@ -666,7 +1352,9 @@ class MasterSkillOrchestrator:
         task: str,
         mode: str = "auto",
         provider: str = "claude",
-        context: dict = None
+        context: dict = None,
+        dependencies: dict[str, list[str]] = None,
+        resume: bool = True
     ) -> dict:
         """
         Activate skills for a task with real execution.
@@ -674,8 +1362,11 @@ class MasterSkillOrchestrator:
         Args:
             task: Task description
             mode: Execution mode (auto, sequential, parallel, pipeline, cli, swarm)
-            provider: CLI provider for execution
+            provider: CLI provider for execution, or "adaptive" for routed execution
             context: Additional context
+            dependencies: Pipeline dependency graph (skill name -> upstream skill
+                names). Without it, pipeline stages are chained in match order.
+            resume: Reuse stage results cached by an earlier failed pipeline run
         """
         # Find matching skills
         matches = self.registry.find_matching(task, limit=10)
@@ -690,11 +1381,11 @@ class MasterSkillOrchestrator:
         
         # Execute based on mode
         if mode == "cli":
-            result = self.execute_via_cli(task, provider, context)
+            result = self.execute_via_cli(task, provider, context, selected[0].category)
             return {
                 "task": task,
                 "mode": "cli",
-                "provider": provider,
+                "provider": result.provider,
                 "result": result.__dict__
             }
         
@@ -723,20 +1414,78 @@ class MasterSkillOrchestrator:
                 "results": [r.__dict__ for r in results]
             }
         
-        else:  # auto, sequential, pipeline
-            # Execute via CLI sequentially
-            cli_result = self.execute_via_cli(task, provider, context)
+        elif mode in ("sequential", "pipeline"):
+            return self._run_pipeline(
+                task,
+                selected,
+                mode,
+                provider,
+                context,
+                dependencies if mode == "pipeline" else None,
+                resume
+            )
+        
+        else:  # auto
+            # Execute via CLI
+            cli_result = self.execute_via_cli(task, provider, context, selected[0].category)
             
             return {
                 "task": task,
                 "mode": mode,
-                "provider": provider,
+                "provider": cli_result.provider,
                 "skills_used": [s.name for s in selected],
                 "cli_result": cli_result.__dict__
             }
     
+    def _run_pipeline(
+        self,
+        task: str,
+        selected: list[Skill],
+        mode: str,
+        provider: str,
+        context: dict = None,
+        dependencies: dict[str, list[str]] = None,
+        resume: bool = True
+    ) -> dict:
+        """Run selected skills as pipeline stages, resuming a failed run if asked."""
+        def execute_stage(stage: PipelineStage, stage_context: dict) -> ExecutionResult:
+            prompt = f"Using skill '{stage.skill.name}' ({stage.skill.description[:200]}): {task}"
+            for dep, output in stage_context["upstream"].items():
+                prompt += f"\n\nResult from {dep}:\n{output}"
+            return self.execute_via_cli(prompt, provider, stage_context, stage.skill.category)
+        
+        if dependencies is None:
+            pipeline = SkillPipeline.chain(
+                selected,
+                execute=execute_stage,
+                cache=self.pipeline_cache,
+                max_concurrent=1 if mode == "sequential" else 5
+            )
+        else:
+            names = {s.name for s in selected}
+            stages = [
+                PipelineStage(s.name, s, [d for d in dependencies.get(s.name, []) if d in names])
+                for s in selected
+            ]
+            pipeline = SkillPipeline(stages, execute=execute_stage, cache=self.pipeline_cache)
+        
+        results = pipeline.run(task, context, resume=resume)
+        
+        return {
+            "task": task,
+            "mode": mode,
+            "provider": provider,
+            "skills_used": list(results.keys()),
+            "success": all(r.success for r in results.values()),
+            "resumed_stages": pipeline.resumed,
+            "stages": {name: r.__dict__ for name, r in results.items()}
+        }
+    
     def _select_template(self, category: str) -> str:
         """Select appropriate swarm template based on category."""
+        if category in self._template_cache:
+            return self._template_cache[category]
+        
         category_templates = {
             "Research": "ai-researcher",
             "Code": "code-specialist",
@@ -745,11 +1494,14 @@ class MasterSkillOrchestrator:
             "General": "ai-researcher"
         }
         
+        selected = "ai-researcher"
         for cat, template in category_templates.items():
             if cat.lower() in category.lower():
-                return template
+                selected = template
+                break
         
-        return "ai-researcher"
+        self._template_cache[category] = selected
+        return selected
     
     def research(self, query: str, provider: str = "claude") -> dict:
         """Execute a research task."""
@@ -776,7 +1528,8 @@ class MasterSkillOrchestrator:
             results[provider] = {
                 "success": result.success,
                 "execution_time": result.execution_time,
-                "output_length": len(str(result.output)) if result.output else 0
+                "output_length": len(str(result.output)) if result.output else 0,
+                "expected_completion_time": self.router.expected_completion_time(provider)
             }
         
         return {
@@ -800,6 +1553,7 @@ class MasterSkillOrchestrator:
         stats["swarm_templates"] = len(self.swarm.templates)
         stats["total_executions"] = len(self.execution_log)
         stats["recent_executions"] = self.execution_log[-10:]
+        stats["provider_routing"] = self.router.snapshot()
         return stats
     
     def find_skills(self, query: str, limit: int = 10) -> list[tuple[Skill, float]]:
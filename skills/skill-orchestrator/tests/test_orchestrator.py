@@ -0,0 +1,229 @@
+# test_orchestrator.py
+import sys
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from orchestrator import (
+    AgentSwarmExecutor,
+    ConfidenceStore,
+    ExecutionResult,
+    PipelineCache,
+    ProviderRouter,
+    Skill,
+    SkillPipeline,
+    SkillSource,
+)
+
+
+def _skills(*names):
+    """Minimal local skills for pipeline tests."""
+    return [Skill(name, SkillSource.LOCAL, f"/tmp/{name}", "General", name) for name in names]
+
+
+class CountingExecutor:
+    """Stage executor that records calls and fails the stages it is told to."""
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+
+    def __call__(self, stage, context):
+        self.calls.append(stage.name)
+        return ExecutionResult(
+            success=stage.name not in self.fail,
+            skill_name=stage.skill.name,
+            provider="test",
+            output=f"{stage.name} output"
+        )
+
+
+def test_router_prefers_slow_success_over_fast_failure():
+    """A provider that always fails instantly must lose to one that succeeds slowly."""
+    router = ProviderRouter(["kimi", "claude"], exploration_rate=0.0, seed=1)
+    for _ in range(10):
+        router.observe({"provider": "kimi", "execution_time": 0.001, "success": False})
+        router.observe({"provider": "claude", "execution_time": 8.0, "success": True})
+
+    assert router.select() == "claude"
+    assert router.expected_completion_time("kimi") > router.expected_completion_time("claude")
+
+
+def test_router_prefers_faster_provider_when_both_succeed():
+    """With equal success rates the lower latency wins."""
+    router = ProviderRouter(["kimi", "claude"], exploration_rate=0.0, seed=1)
+    for _ in range(5):
+        router.observe({"provider": "kimi", "execution_time": 2.0, "success": True})
+        router.observe({"provider": "claude", "execution_time": 8.0, "success": True})
+
+    assert router.select() == "kimi"
+    assert router.expected_completion_time("kimi") == 2.0
+
+
+def test_router_uses_configured_failure_cost():
+    """An explicit failure_cost (e.g. the CLI timeout) is charged per failure."""
+    router = ProviderRouter(["kimi"], failure_cost=300.0)
+    router.observe({"provider": "kimi", "execution_time": 1.0, "success": True})
+    router.observe({"provider": "kimi", "execution_time": 0.001, "success": False})
+
+    # success_rate decays to 0.8: 1s + 0.25 expected retries x 300s
+    assert router.expected_completion_time("kimi") == pytest.approx(76.0)
+
+
+def test_pipeline_fresh_successful_run_reexecutes_stages(tmp_path):
+    """A pipeline that succeeded leaves nothing behind to short-circuit the next run."""
+    cache = PipelineCache(str(tmp_path / "cache"))
+    execute = CountingExecutor()
+    pipeline = SkillPipeline.chain(_skills("a", "b"), execute=execute, cache=cache)
+
+    pipeline.run("task")
+    pipeline.run("task")
+
+    assert execute.calls == ["a", "b", "a", "b"]
+    assert pipeline.resumed == []
+    assert list((tmp_path / "cache").glob("*.json")) == []
+
+
+def test_pipeline_resumes_after_failure(tmp_path):
+    """Rerunning a failed pipeline skips the stages that already succeeded."""
+    cache = PipelineCache(str(tmp_path / "cache"))
+    failing = CountingExecutor(fail={"b"})
+    SkillPipeline.chain(_skills("a", "b"), execute=failing, cache=cache).run("task")
+
+    execute = CountingExecutor()
+    pipeline = SkillPipeline.chain(_skills("a", "b"), execute=execute, cache=cache)
+    results = pipeline.run("task")
+
+    assert execute.calls == ["b"]
+    assert pipeline.resumed == ["a"]
+    assert all(r.success for r in results.values())
+
+
+def test_pipeline_resume_disabled_reruns_everything(tmp_path):
+    """resume=False ignores results cached by a failed run."""
+    cache = PipelineCache(str(tmp_path / "cache"))
+    SkillPipeline.chain(_skills("a", "b"), execute=CountingExecutor(fail={"b"}), cache=cache).run("task")
+
+    execute = CountingExecutor()
+    SkillPipeline.chain(_skills("a", "b"), execute=execute, cache=cache).run("task", resume=False)
+
+    assert execute.calls == ["a", "b"]
+
+
+def test_pipeline_cache_expires_and_caps_entries(tmp_path):
+    """Entries past the TTL are dropped, and the directory is capped at max_entries."""
+    result = ExecutionResult(success=True, skill_name="a", provider="test", output="x")
+
+    expired = PipelineCache(str(tmp_path / "ttl"), ttl=-1)
+    expired.put("k", result)
+    assert expired.get("k") is None
+    assert not (tmp_path / "ttl" / "k.json").exists()
+
+    capped = PipelineCache(str(tmp_path / "cap"), max_entries=3)
+    for i in range(10):
+        capped.put(f"k{i}", result)
+    assert len(list((tmp_path / "cap").glob("*.json"))) == 3
+
+
+# Subagent stand-in that echoes the prompt it was given
+ECHO_COMMAND = [sys.executable, "-c", "import sys; print(sys.argv[-1])"]
+
+
+def _swarm(tmp_path) -> AgentSwarmExecutor:
+    """Swarm executor with one template that echoes its prompt."""
+    templates = tmp_path / "agent-swarm" / "templates"
+    templates.mkdir(parents=True)
+    (templates / "echo.json").write_text(json.dumps({
+        "name": "echo",
+        "role": "Echo",
+        "description": "Echo the prompt",
+        "system_prompt": "Echo."
+    }))
+    return AgentSwarmExecutor(str(tmp_path / "agent-swarm"), cli_command=ECHO_COMMAND)
+
+
+def test_swarm_sees_context_mutated_between_calls(tmp_path):
+    """Reusing a context dict after mutating it must not send the stale JSON."""
+    swarm = _swarm(tmp_path)
+    context = {"step": 1}
+
+    first = swarm.spawn_subagent("echo", "task", context)
+    context["step"] = 2
+    second = swarm.spawn_subagent("echo", "task", context)
+
+    assert '"step": 1' in first.output
+    assert '"step": 2' in second.output
+
+    context["step"] = 3
+    results = swarm.execute_parallel([{"template": "echo", "task": "task", "context": context}] * 2)
+    assert all('"step": 3' in r.output for r in results)
+
+
+def _stored_usage(db_path, name):
+    """usage_count on disk for one skill, or None."""
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT usage_count FROM skill_confidence WHERE name = ?", (name,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def test_confidence_store_counts_repeated_updates_towards_flush(tmp_path):
+    """flush_every counts buffered updates, not distinct skills."""
+    db_path = tmp_path / "confidence.db"
+    store = ConfidenceStore(str(db_path), flush_every=5, flush_interval=3600)
+
+    for _ in range(4):
+        store.record("a", 0.5, 0.01, 1.0)
+    assert _stored_usage(db_path, "a") is None
+
+    store.record("a", 0.5, 0.01, 1.0)
+    assert _stored_usage(db_path, "a") == 5
+
+
+def test_confidence_store_closes_its_connections(tmp_path, monkeypatch):
+    """Every connection is closed once its batch is committed."""
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    store = ConfidenceStore(str(tmp_path / "confidence.db"))
+    store.record("a", 0.5, 0.01, 1.0)
+    assert store.load_all()["a"][1] == 1
+
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_confidence_store_merges_batches_from_several_stores(tmp_path):
+    """Buffered deltas from two stores on one database add up instead of overwriting."""
+    db_path = tmp_path / "confidence.db"
+    first = ConfidenceStore(str(db_path), flush_every=100, flush_interval=3600)
+    second = ConfidenceStore(str(db_path), flush_every=100, flush_interval=3600)
+
+    for _ in range(3):
+        first.record("a", 0.5, 0.05, 10.0)
+    for _ in range(2):
+        second.record("a", 0.5, 0.05, 20.0)
+    second.record("b", 0.95, 0.2, 5.0)
+    assert _stored_usage(db_path, "a") is None
+
+    first.flush()
+    stored = second.load_all()
+
+    assert stored["a"] == (pytest.approx(0.75), 5, 20.0)
+    assert stored["b"] == (1.0, 1, 5.0)